@@ -0,0 +1,384 @@
+"""
+Browser Pool - Shared Playwright browsers
+Lazily starts Playwright and Chromium once per process and hands out
+fresh browser contexts, so back-to-back inspections skip the cold start.
+BrowserPool keeps several browsers warm for repeated scrape runs.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright, Response
+
+
+logger = logging.getLogger(__name__)
+
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_lock: Optional[asyncio.Lock] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_trackers: "weakref.WeakKeyDictionary[BrowserContext, RetryAfterTracker]" = weakref.WeakKeyDictionary()
+
+# BrowserPool defaults, overridable from the environment
+POOL_MIN_SIZE = int(os.environ.get('SCRAPER_POOL_MIN_SIZE', '1'))
+POOL_MAX_SIZE = int(os.environ.get('SCRAPER_POOL_MAX_SIZE', '2'))
+POOL_IDLE_TIMEOUT = float(os.environ.get('SCRAPER_POOL_IDLE_TIMEOUT_MS', '300000')) / 1000
+POOL_ACQUIRE_TIMEOUT = float(os.environ.get('SCRAPER_POOL_ACQUIRE_TIMEOUT_MS', '60000')) / 1000
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds.
+    
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+    
+    Returns:
+        Seconds to wait (never negative), or None if missing/unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryAfterTracker:
+    """Remembers the latest server-mandated cooldown from 429/503 responses."""
+    
+    RETRY_STATUSES = (429, 503)
+    
+    def __init__(self):
+        self._retry_at = 0.0
+    
+    def observe(self, response: Response):
+        """Response event handler recording any Retry-After cooldown."""
+        if response.status not in self.RETRY_STATUSES:
+            return
+        seconds = parse_retry_after(response.headers.get('retry-after'))
+        if seconds is not None:
+            self._retry_at = max(self._retry_at, time.monotonic() + seconds)
+            logger.warning(f"HTTP {response.status} from {response.url}, Retry-After {seconds:.0f}s")
+    
+    def peek(self) -> float:
+        """Return the seconds remaining in the current cooldown (0 if none)."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+
+def retry_after_tracker(ctx: BrowserContext) -> Optional[RetryAfterTracker]:
+    """Return the RetryAfterTracker attached to a pool context, if any."""
+    return _trackers.get(ctx)
+
+
+def _get_lock() -> asyncio.Lock:
+    """Return the pool lock, resetting state if the event loop has changed."""
+    global _playwright, _browser, _lock, _loop
+    
+    loop = asyncio.get_running_loop()
+    if _loop is not loop:
+        # Playwright objects are bound to the loop that created them
+        _playwright = None
+        _browser = None
+        _lock = asyncio.Lock()
+        _loop = loop
+    return _lock
+
+
+async def get_browser(headless: bool = True, args: Optional[List[str]] = None) -> Browser:
+    """
+    Get the shared browser, launching it on first use.
+    
+    Args:
+        headless: Whether to run the browser in headless mode
+        args: Extra Chromium command-line arguments
+    
+    Launch options only apply to the first call; later calls reuse the
+    running browser as-is.
+    
+    Returns:
+        Shared Browser instance
+    """
+    global _playwright, _browser
+    
+    async with _get_lock():
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=headless, args=args or [])
+            logger.info("Shared browser launched")
+    return _browser
+
+
+async def get_context(headless: bool = True, args: Optional[List[str]] = None, **context_options) -> BrowserContext:
+    """
+    Create a new context on the shared browser.
+    
+    Each context gets a RetryAfterTracker, available via retry_after_tracker().
+    
+    Args:
+        headless: Whether to run the browser in headless mode
+        args: Extra Chromium command-line arguments
+        **context_options: Keyword arguments for Browser.new_context
+    
+    Returns:
+        New BrowserContext (caller is responsible for closing it)
+    """
+    browser = await get_browser(headless=headless, args=args)
+    ctx = await browser.new_context(**context_options)
+    
+    tracker = RetryAfterTracker()
+    ctx.on('response', tracker.observe)
+    _trackers[ctx] = tracker
+    return ctx
+
+
+@asynccontextmanager
+async def context(headless: bool = True, args: Optional[List[str]] = None, **context_options):
+    """Async context manager yielding a context that is closed on exit."""
+    ctx = await get_context(headless=headless, args=args, **context_options)
+    try:
+        yield ctx
+    finally:
+        await ctx.close()
+
+
+async def close():
+    """Close the shared browser and stop Playwright."""
+    global _playwright, _browser
+    
+    async with _get_lock():
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+            logger.info("Shared browser closed")
+
+
+class BrowserPool:
+    """
+    Pool of launched browsers reused across scrape runs.
+    
+    A background task replaces browsers that have disconnected and closes
+    ones left idle longer than idle_timeout, keeping at least min_size warm.
+    """
+    
+    def __init__(
+        self,
+        headless: bool = True,
+        args: Optional[List[str]] = None,
+        idle_timeout: float = POOL_IDLE_TIMEOUT,
+        acquire_timeout: float = POOL_ACQUIRE_TIMEOUT,
+        check_interval: float = 30.0,
+    ):
+        """
+        Create an empty pool; call initialize() before acquiring.
+        
+        Args:
+            headless: Whether to launch browsers in headless mode
+            args: Extra Chromium command-line arguments
+            idle_timeout: Seconds an unused browser is kept above min_size
+            acquire_timeout: Default seconds acquire() waits for a free browser
+            check_interval: Seconds between health checks and idle cleanup
+        """
+        self.headless = headless
+        self.args = args or []
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.check_interval = check_interval
+        self.min_size = 0
+        self.max_size = 0
+        self.stats: Dict[str, float] = {'acquired': 0, 'launched': 0, 'replaced': 0, 'reaped': 0, 'wait_s': 0.0}
+        self._playwright: Optional[Playwright] = None
+        self._idle: Deque[Tuple[Browser, float]] = deque()
+        self._in_use: Set[Browser] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._task: Optional[asyncio.Task] = None
+        # Set by release() so drain() can wait for checked-out browsers
+        self._returned = asyncio.Event()
+    
+    async def initialize(self, min_size: int = POOL_MIN_SIZE, max_size: int = POOL_MAX_SIZE):
+        """
+        Launch min_size browsers and start the maintenance task.
+        
+        Args:
+            min_size: Browsers kept warm even when idle
+            max_size: Maximum browsers launched at once
+        """
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self._slots = asyncio.Semaphore(self.max_size)
+        for _ in range(self.min_size):
+            self._idle.append((await self._launch(), time.monotonic()))
+        self._task = asyncio.create_task(self._maintain())
+        logger.info(f"Browser pool ready ({self.min_size}-{self.max_size} browsers)")
+    
+    async def _launch(self) -> Browser:
+        """Launch one browser, starting Playwright on first use."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self.stats['launched'] += 1
+        return await self._playwright.chromium.launch(headless=self.headless, args=self.args)
+    
+    async def acquire(self, timeout: Optional[float] = None) -> Browser:
+        """
+        Take a browser from the pool, launching one if none is idle.
+        
+        Args:
+            timeout: Seconds to wait for a free slot (default: acquire_timeout;
+                0 fails at once unless a slot is free)
+        
+        Returns:
+            Connected Browser; hand it back with release()
+        
+        Raises:
+            asyncio.TimeoutError: If max_size browsers stay busy for timeout seconds
+        """
+        if self._slots is None:
+            raise RuntimeError("Browser pool not initialized")
+        
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        if timeout <= 0:
+            # wait_for() with no time left would cancel even an uncontested acquire
+            if self._slots.locked():
+                raise asyncio.TimeoutError("No free browser in the pool")
+            await self._slots.acquire()
+        else:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        try:
+            browser = None
+            while self._idle:
+                candidate, _ = self._idle.pop()
+                if candidate.is_connected():
+                    browser = candidate
+                    break
+                self.stats['replaced'] += 1
+            if browser is None:
+                browser = await self._launch()
+        except BaseException:
+            self._slots.release()
+            raise
+        
+        self._in_use.add(browser)
+        self.stats['acquired'] += 1
+        self.stats['wait_s'] += time.monotonic() - started
+        return browser
+    
+    async def release(self, browser: Browser):
+        """Return a browser from acquire(), dropping it if it has disconnected."""
+        self._in_use.discard(browser)
+        if browser.is_connected():
+            self._idle.append((browser, time.monotonic()))
+        else:
+            self.stats['replaced'] += 1
+        self._slots.release()
+        self._returned.set()
+    
+    @asynccontextmanager
+    async def browser(self, timeout: Optional[float] = None):
+        """Async context manager acquiring a browser and releasing it on exit."""
+        browser = await self.acquire(timeout)
+        try:
+            yield browser
+        finally:
+            await self.release(browser)
+    
+    async def _check_health(self):
+        """Drop disconnected idle browsers and top the pool back up to min_size."""
+        healthy = deque(entry for entry in self._idle if entry[0].is_connected())
+        self.stats['replaced'] += len(self._idle) - len(healthy)
+        self._idle = healthy
+        while len(self._idle) + len(self._in_use) < self.min_size:
+            # Launch within a slot, like acquire(), so the two never exceed
+            # max_size together; with every slot busy acquire() launches instead
+            if self._slots.locked():
+                break
+            await self._slots.acquire()
+            try:
+                self._idle.append((await self._launch(), time.monotonic()))
+            finally:
+                self._slots.release()
+    
+    async def _reap_idle(self):
+        """Close browsers idle past idle_timeout, keeping min_size in total."""
+        now = time.monotonic()
+        # Oldest entries are on the left; acquire() reuses from the right
+        while (
+            self._idle
+            and len(self._idle) + len(self._in_use) > self.min_size
+            and now - self._idle[0][1] > self.idle_timeout
+        ):
+            browser, _ = self._idle.popleft()
+            self.stats['reaped'] += 1
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing idle browser: {e}")
+    
+    async def _maintain(self):
+        """Background loop running the health check and idle cleanup."""
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                await self._check_health()
+                await self._reap_idle()
+            except Exception as e:
+                logger.warning(f"Browser pool maintenance failed: {e}")
+    
+    async def _wait_returned(self):
+        """Wait until every checked-out browser has been released."""
+        while self._in_use:
+            self._returned.clear()
+            await self._returned.wait()
+    
+    async def drain(self, timeout: float = 5.0):
+        """
+        Stop maintenance, close every browser and stop Playwright.
+        
+        Args:
+            timeout: Seconds to wait for checked-out browsers to be released
+                before closing them anyway
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        if self._in_use:
+            try:
+                await asyncio.wait_for(self._wait_returned(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Closing {len(self._in_use)} browser(s) still checked out")
+        
+        browsers = [browser for browser, _ in self._idle] + list(self._in_use)
+        self._idle.clear()
+        self._in_use.clear()
+        for browser in browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled browser: {e}")
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info(f"Browser pool drained ({self.stats})")
@@ -2,6 +2,12 @@
 Configuration file for Microsoft Careers Scraper
 """
 
+import sys
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
 # Scraper settings
 SCRAPER_CONFIG = {
     'headless': False,  # Set to True for headless mode
@@ -19,6 +25,9 @@ BROWSER_CONFIG = {
     'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'locale': 'en-US',
     'timezone_id': 'America/Los_Angeles',
+    # Subresource types aborted by route interception. CSS is kept: visibility
+    # checks and diagnostic screenshots depend on computed styles
+    'block_resource_types': ['image', 'font', 'media'],
 }
 
 # Timing settings (in seconds)
@@ -41,6 +50,20 @@ RETRY_CONFIG = {
     'backoff_max': 30,
 }
 
+# Client-side pacing for page loads and search submissions (see rate_limit.py)
+RATE_LIMIT_CONFIG = {
+    'rps': 2,
+    'burst': 5,
+}
+
+# Adaptive concurrency for scraper navigations (see rate_limit.AIMDController)
+AIMD_CONFIG = {
+    'concurrency': 2.0,
+    'target_latency': 10.0,  # seconds
+    'alpha': 0.5,
+    'beta': 0.5,
+}
+
 # Selectors for Microsoft Careers
 SELECTORS = {
     'job_title_input': [
@@ -102,6 +125,7 @@ SELECTORS = {
     'job_location': [
         'i[data-icon-name="POI"] + span',  # ⭐ ACTUAL: span after location icon
         'i.wwxC8vs2c2O5YaFddx7C + span',  # Alternative with class
+        'span:has(+ i[data-icon-name="POI"])',  # Span just before the location icon
         '[class*="location"]',
         '[class*="Location"]',
         '[aria-label*="location"]',
@@ -135,6 +159,28 @@ SELECTORS = {
     ],
 }
 
+# Each fallback list pre-joined into a single CSS selector-list, so one query
+# matches any of the fallbacks in a single pass over the DOM. Matches come back
+# in document order, so use the lists above when fallback priority matters.
+# Note: some entries use Playwright-only pseudo-classes (e.g. :has-text), so
+# these strings are meant for Playwright selectors, not document.querySelector.
+SELECTORS_JOINED = {key: ', '.join(selectors) for key, selectors in SELECTORS.items()}
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selectors: tuple) -> str:
+    """
+    Join an ordered tuple of fallback selectors into one cached selector-list.
+    
+    Args:
+        selectors: Tuple of CSS selectors (must be hashable for caching)
+    
+    Returns:
+        Comma-separated selector string
+    """
+    return ', '.join(selectors)
+
+
 # Output settings
 OUTPUT_CONFIG = {
     'directory': 'output',
@@ -143,9 +189,62 @@ OUTPUT_CONFIG = {
     'timestamp_format': '%Y%m%d_%H%M%S',
 }
 
+# Result cache keyed by (job_title, location, max_jobs); see scrape_cache.py
+CACHE_CONFIG = {
+    'path': 'output/.scrape_cache.sqlite',
+    # Seconds to reuse a search's result; opt-in, since a hit returns jobs as
+    # they were then (e.g. 6 * 60 * 60 reuses results for six hours)
+    'ttl_s': 0,  # 0 disables the cache
+    # Cookies/localStorage saved after accepting cookie consent, so later
+    # runs skip the banner ('' disables)
+    'storage_state': '.pw_state.json',
+}
+
+
+# Diagnostic screenshot settings (viewport-only JPEG is far cheaper than a full-page PNG)
+SCREENSHOT_CONFIG = {
+    'type': 'jpeg',
+    'quality': 60,
+    'full_page': False,
+}
+
+
+def make_output_paths(now=None, cfg=OUTPUT_CONFIG):
+    """
+    Build the CSV and JSON output paths for a run from a single timestamp.
+    
+    Args:
+        now: Datetime to stamp the filenames with (defaults to datetime.now())
+        cfg: Output settings (directory, prefixes, timestamp_format)
+    
+    Returns:
+        Tuple of (csv_path, json_path) sharing one timestamp; the output
+        directory is created if needed
+    """
+    timestamp = (now or datetime.now()).strftime(cfg['timestamp_format'])
+    output_dir = Path(cfg['directory'])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return (
+        output_dir / f"{cfg['csv_prefix']}_{timestamp}.csv",
+        output_dir / f"{cfg['json_prefix']}_{timestamp}.json",
+    )
+
 # Logging settings
 LOGGING_CONFIG = {
     'level': 'INFO',  # DEBUG, INFO, WARNING, ERROR, CRITICAL
     'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     'date_format': '%Y-%m-%d %H:%M:%S',
 }
+
+# Freeze shared settings so nothing can mutate them at runtime, and intern
+# selector strings so tuple keys (e.g. for compile_selector) hash and compare fast
+SELECTORS = MappingProxyType({
+    key: tuple(sys.intern(selector) for selector in selectors)
+    for key, selectors in SELECTORS.items()
+})
+SELECTORS_JOINED = MappingProxyType({key: sys.intern(joined) for key, joined in SELECTORS_JOINED.items()})
+SCRAPER_CONFIG = MappingProxyType(SCRAPER_CONFIG)
+TIMING_CONFIG = MappingProxyType(TIMING_CONFIG)
+SCREENSHOT_CONFIG = MappingProxyType(SCREENSHOT_CONFIG)
+RATE_LIMIT_CONFIG = MappingProxyType(RATE_LIMIT_CONFIG)
+AIMD_CONFIG = MappingProxyType(AIMD_CONFIG)
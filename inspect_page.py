@@ -5,325 +5,288 @@ This will help us identify the correct selectors for location field and job list
 """
 
 import asyncio
-from playwright.async_api import async_playwright
+import os
 import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
 
-logging.basicConfig(level=logging.INFO)
+import browser_pool
+from config import BROWSER_CONFIG, LOGGING_CONFIG, RATE_LIMIT_CONFIG, SELECTORS_JOINED, TIMING_CONFIG
+from rate_limit import TokenBucket
+from retry import retry_async
+
+logging.basicConfig(
+    level=LOGGING_CONFIG['level'],
+    format=LOGGING_CONFIG['format'],
+    datefmt=LOGGING_CONFIG['date_format'],
+)
 logger = logging.getLogger(__name__)
 
+# Seconds to keep the browser open after inspecting (0 for CI / unattended runs)
+INSPECT_HOLD_SECONDS = float(os.environ.get('INSPECT_HOLD_SECONDS', '0'))
+
+# Run headless unless INSPECT_HEADLESS=0 (e.g. to watch the page while holding)
+INSPECT_HEADLESS = os.environ.get('INSPECT_HEADLESS', '1') != '0'
+
+BLOCKED_RESOURCE_TYPES = frozenset(BROWSER_CONFIG['block_resource_types'])
+
+HOMEPAGE_URL = "https://careers.microsoft.com/v2/global/en/home.html"
+
+# Paces page loads and search submissions across both inspection pages
+RATE_LIMITER = TokenBucket(**RATE_LIMIT_CONFIG)
+
+# In-page helpers, registered on the context and called via window.__inspect
+INSPECT_SCRIPT = (Path(__file__).parent / 'scripts' / 'inspect.js').read_text()
+
+
+@dataclass
+class InspectionReport:
+    """Merged results of the search-form and results-page inspections."""
+    search_inputs: List[Dict]
+    location_inputs: List[Dict]
+    buttons: List[Dict]
+    job_data: Dict
+    detailed_job: Optional[Dict]
+
+
+async def _block_handler(route):
+    """Abort subresources that aren't needed to read the DOM."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def open_homepage(page, retry_after=None):
+    """Navigate to the careers homepage and wait for the search box."""
+    async def goto():
+        await RATE_LIMITER.acquire()
+        return await page.goto(HOMEPAGE_URL, wait_until='domcontentloaded')
+    
+    await retry_async(goto, tracker=retry_after)
+    await retry_async(lambda: page.wait_for_selector('#search-box9', state='visible', timeout=TIMING_CONFIG['element_timeout']), tracker=retry_after)
+
+
+async def inspect_form(page, retry_after=None) -> Dict:
+    """Load the homepage and inspect the search form."""
+    await open_homepage(page, retry_after)
+    logger.info("✅ Homepage loaded, inspecting search form...")
+    return await page.evaluate("() => window.__inspect.searchForm()")
+
+
+async def do_search(page, retry_after=None):
+    """Load the homepage, search for 'AI' and wait for the results."""
+    await open_homepage(page, retry_after)
+    
+    # Fill search box
+    search_box = await page.query_selector('#search-box9')
+    if search_box:
+        await RATE_LIMITER.acquire()
+        await search_box.fill('AI')
+        logger.info("✅ Filled search box with 'AI'")
+        
+        # Press Enter to search
+        await RATE_LIMITER.acquire()
+        await page.keyboard.press('Enter')
+        logger.info("✅ Pressed Enter to search")
+        
+        # Wait for results
+        logger.info("⏳ Waiting for results to load...")
+        await page.wait_for_selector(SELECTORS_JOINED['job_listings'], timeout=TIMING_CONFIG['element_timeout'])
+        
+        logger.info("✅ Results loaded!")
+
+
+async def inspect_results(page) -> Dict:
+    """Inspect job listings on the current results page."""
+    return await page.evaluate("() => window.__inspect.resultsPage()")
+
+
+def print_report(report: InspectionReport):
+    """Print the inspection findings and recommended selectors."""
+    search_inputs = report.search_inputs
+    location_inputs = report.location_inputs
+    job_data = report.job_data
+    detailed_job = report.detailed_job
+    
+    # Inspect search box
+    logger.info("\n" + "-" * 80)
+    logger.info("🔍 INSPECTING SEARCH BOX (Job Title Field)")
+    logger.info("-" * 80)
+    
+    for inp in search_inputs:
+        logger.info("\nSearch Input #%s:", inp['index'])
+        logger.info("  ID: %s", inp['id'])
+        logger.info("  Class: %s", inp['class'])
+        logger.info("  Placeholder: %s", inp['placeholder'])
+        logger.info("  Aria-Label: %s", inp['ariaLabel'])
+        logger.info("  Name: %s", inp['name'])
+        logger.info("  Role: %s", inp['role'])
+        logger.info("  Type: %s", inp['type'])
+    
+    # Inspect location field
+    logger.info("\n" + "-" * 80)
+    logger.info("📍 INSPECTING LOCATION FIELD")
+    logger.info("-" * 80)
+    
+    if location_inputs:
+        for inp in location_inputs:
+            logger.info("\nLocation Input #%s:", inp['index'])
+            logger.info("  ID: %s", inp['id'])
+            logger.info("  Class: %s", inp['class'])
+            logger.info("  Placeholder: %s", inp['placeholder'])
+            logger.info("  Aria-Label: %s", inp['ariaLabel'])
+            logger.info("  Name: %s", inp['name'])
+            logger.info("  Visible: %s", inp['visible'])
+    else:
+        logger.info("\n⚠️  No location inputs found! Microsoft might not have a separate location field.")
+    
+    # Inspect search button
+    logger.info("\n" + "-" * 80)
+    logger.info("🔘 INSPECTING SEARCH BUTTON")
+    logger.info("-" * 80)
+    
+    for btn in report.buttons:
+        logger.info("\nButton #%s:", btn['index'])
+        logger.info("  ID: %s", btn['id'])
+        logger.info("  Class: %s", btn['class'])
+        logger.info("  Text: %s", btn['text'])
+        logger.info("  Aria-Label: %s", btn['ariaLabel'])
+        logger.info("  Type: %s", btn['type'])
+    
+    # Inspect job listing elements
+    logger.info("\n" + "-" * 80)
+    logger.info("📋 INSPECTING JOB LISTINGS ON RESULTS PAGE")
+    logger.info("-" * 80)
+    
+    logger.info("\n📊 Job Listing Counts:")
+    for selector, count in job_data['counts'].items():
+        logger.info("  %s: %s", selector, count)
+    
+    logger.info("\n📝 Sample Job Elements (first 3):")
+    for idx, sample in enumerate(job_data['samples'], 1):
+        logger.info("\nSample #%s:", idx)
+        logger.info("  Tag: %s", sample['tagName'])
+        logger.info("  Class: %s", sample['className'])
+        logger.info("  ID: %s", sample['id'])
+        logger.info("  Data Attributes: %s", sample['dataAttributes'])
+        logger.info("  Inner HTML Preview: %s...", sample['innerHTML'][:150])
+    
+    # Get detailed structure of first job listing
+    logger.info("\n" + "-" * 80)
+    logger.info("🔬 DETAILED STRUCTURE OF FIRST JOB LISTING")
+    logger.info("-" * 80)
+    
+    if detailed_job:
+        logger.info("\n📦 Container:")
+        logger.info("  Classes: %s", detailed_job['classes'])
+        logger.info("\n  HTML Preview:\n%s...\n", detailed_job['outerHTML'])
+        
+        logger.info("📌 Title Elements Found:")
+        for title in detailed_job['titles']:
+            logger.info("  - %s.%s: %s", title['tag'], title['class'], title['text'])
+        
+        logger.info("\n📍 Location Elements Found:")
+        for loc in detailed_job['locations']:
+            logger.info("  - %s.%s: %s", loc['tag'], loc['class'], loc['text'])
+        
+        logger.info("\n🔗 Links Found:")
+        for link in detailed_job['links'][:3]:  # First 3 links
+            logger.info("  - %s: %s", link['class'], link['text'])
+            logger.info("    URL: %s", link['href'])
+    else:
+        logger.info("\n⚠️  Could not find any job listing container!")
+    
+    logger.info("\n" + "="*80)
+    logger.info("🎯 RECOMMENDED SELECTORS")
+    logger.info("="*80 + "\n")
+    
+    # Generate recommendations
+    if search_inputs:
+        logger.info("Job Title Field:")
+        logger.info("  Primary: #%s", search_inputs[0]['id'])
+        logger.info("  Backup: .%s", search_inputs[0]['class'].split()[0] if search_inputs[0]['class'] != 'N/A' else 'ms-SearchBox-field')
+    
+    if location_inputs:
+        logger.info("\nLocation Field:")
+        logger.info("  Primary: #%s", location_inputs[0]['id'])
+        logger.info("  Backup: input[placeholder*='%s']", location_inputs[0]['placeholder'][:20])
+    else:
+        logger.info("\n⚠️  No location field - Microsoft might use a different approach")
+    
+    if detailed_job and detailed_job['classes']:
+        logger.info("\nJob Listing Container:")
+        main_class = detailed_job['classes'].split()[0] if detailed_job['classes'] else 'unknown'
+        logger.info("  Primary: .%s", main_class)
+        logger.info("  Backup: [class*='%s']", main_class[:10])
+
 
 async def inspect_page():
     """Inspect the Microsoft Careers page to find actual selectors."""
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=False,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-notifications',
-                '--disable-popup-blocking',
-            ]
+    args = ['--disable-blink-features=AutomationControlled']
+    if not INSPECT_HEADLESS:
+        args += ['--disable-notifications', '--disable-popup-blocking']
+    
+    async with browser_pool.context(
+        headless=INSPECT_HEADLESS,
+        args=args,
+        viewport={'width': 1920, 'height': 1080},
+        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+        permissions=[],
+    ) as context:
+        await context.route("**/*", _block_handler)
+        await context.add_init_script(INSPECT_SCRIPT)
+        retry_after = browser_pool.retry_after_tracker(context)
+        
+        logger.info("\n" + "="*80)
+        logger.info("MICROSOFT CAREERS PAGE INSPECTOR")
+        logger.info("="*80 + "\n")
+        
+        # The form inspection and the search are independent, so run them on
+        # separate pages concurrently
+        page_form = await context.new_page()
+        page_results = await context.new_page()
+        
+        async def search_and_inspect_results():
+            await do_search(page_results, retry_after)
+            return await inspect_results(page_results)
+        
+        logger.info("📍 Navigating to Microsoft Careers and searching for 'AI'...")
+        form, results = await asyncio.gather(
+            inspect_form(page_form, retry_after),
+            search_and_inspect_results(),
         )
         
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            permissions=[],
+        report = InspectionReport(
+            search_inputs=form['search'],
+            location_inputs=form['location'],
+            buttons=form['buttons'],
+            job_data=results['jobs'],
+            detailed_job=results['detailed'],
         )
+        print_report(report)
         
-        page = await context.new_page()
-        
-        print("\n" + "="*80)
-        print("MICROSOFT CAREERS PAGE INSPECTOR")
-        print("="*80 + "\n")
-        
-        # Navigate to homepage
-        print("📍 Navigating to Microsoft Careers...")
-        await page.goto("https://careers.microsoft.com/v2/global/en/home.html", wait_until='networkidle')
-        await asyncio.sleep(3)
-        
-        print("✅ Page loaded!\n")
-        
-        # Inspect search box
-        print("-" * 80)
-        print("🔍 INSPECTING SEARCH BOX (Job Title Field)")
-        print("-" * 80)
-        
-        search_box_script = """
-        () => {
-            const searchInputs = document.querySelectorAll('input[type="search"], input[role="searchbox"], input.ms-SearchBox-field, input[placeholder*="job"], input[placeholder*="keyword"]');
-            const results = [];
-            searchInputs.forEach((input, idx) => {
-                results.push({
-                    index: idx,
-                    id: input.id || 'N/A',
-                    class: input.className || 'N/A',
-                    placeholder: input.placeholder || 'N/A',
-                    ariaLabel: input.getAttribute('aria-label') || 'N/A',
-                    name: input.name || 'N/A',
-                    role: input.role || 'N/A',
-                    type: input.type || 'N/A',
-                });
-            });
-            return results;
-        }
-        """
-        
-        search_inputs = await page.evaluate(search_box_script)
-        for inp in search_inputs:
-            print(f"\nSearch Input #{inp['index']}:")
-            print(f"  ID: {inp['id']}")
-            print(f"  Class: {inp['class']}")
-            print(f"  Placeholder: {inp['placeholder']}")
-            print(f"  Aria-Label: {inp['ariaLabel']}")
-            print(f"  Name: {inp['name']}")
-            print(f"  Role: {inp['role']}")
-            print(f"  Type: {inp['type']}")
-        
-        # Inspect location field
-        print("\n" + "-" * 80)
-        print("📍 INSPECTING LOCATION FIELD")
-        print("-" * 80)
-        
-        location_script = """
-        () => {
-            const locationInputs = document.querySelectorAll('input[placeholder*="location"], input[placeholder*="city"], input[placeholder*="where"], input[aria-label*="location"]');
-            const results = [];
-            locationInputs.forEach((input, idx) => {
-                results.push({
-                    index: idx,
-                    id: input.id || 'N/A',
-                    class: input.className || 'N/A',
-                    placeholder: input.placeholder || 'N/A',
-                    ariaLabel: input.getAttribute('aria-label') || 'N/A',
-                    name: input.name || 'N/A',
-                    role: input.role || 'N/A',
-                    type: input.type || 'N/A',
-                    visible: window.getComputedStyle(input).display !== 'none'
-                });
-            });
-            return results;
-        }
-        """
-        
-        location_inputs = await page.evaluate(location_script)
-        if location_inputs:
-            for inp in location_inputs:
-                print(f"\nLocation Input #{inp['index']}:")
-                print(f"  ID: {inp['id']}")
-                print(f"  Class: {inp['class']}")
-                print(f"  Placeholder: {inp['placeholder']}")
-                print(f"  Aria-Label: {inp['ariaLabel']}")
-                print(f"  Name: {inp['name']}")
-                print(f"  Visible: {inp['visible']}")
-        else:
-            print("\n⚠️  No location inputs found! Microsoft might not have a separate location field.")
-        
-        # Inspect search button
-        print("\n" + "-" * 80)
-        print("🔘 INSPECTING SEARCH BUTTON")
-        print("-" * 80)
-        
-        button_script = """
-        () => {
-            const buttons = document.querySelectorAll('button[type="submit"], button.search-button, button[aria-label*="search"], button[aria-label*="find"]');
-            const results = [];
-            buttons.forEach((btn, idx) => {
-                results.push({
-                    index: idx,
-                    id: btn.id || 'N/A',
-                    class: btn.className || 'N/A',
-                    text: btn.textContent.trim(),
-                    ariaLabel: btn.getAttribute('aria-label') || 'N/A',
-                    type: btn.type || 'N/A',
-                });
-            });
-            return results;
-        }
-        """
-        
-        buttons = await page.evaluate(button_script)
-        for btn in buttons:
-            print(f"\nButton #{btn['index']}:")
-            print(f"  ID: {btn['id']}")
-            print(f"  Class: {btn['class']}")
-            print(f"  Text: {btn['text']}")
-            print(f"  Aria-Label: {btn['ariaLabel']}")
-            print(f"  Type: {btn['type']}")
-        
-        # Now fill in the search and wait for results
-        print("\n" + "="*80)
-        print("🔍 PERFORMING SEARCH FOR 'AI'")
-        print("="*80 + "\n")
-        
-        # Fill search box
-        search_box = await page.query_selector('#search-box9')
-        if search_box:
-            await search_box.fill('AI')
-            print("✅ Filled search box with 'AI'")
-            await asyncio.sleep(1)
-            
-            # Press Enter to search
-            await page.keyboard.press('Enter')
-            print("✅ Pressed Enter to search")
-            
-            # Wait for results
-            print("⏳ Waiting for results to load...")
-            await page.wait_for_load_state('networkidle', timeout=30000)
-            await asyncio.sleep(3)
-            
-            print("✅ Results loaded!\n")
-        
-        # Inspect job listing elements
-        print("-" * 80)
-        print("📋 INSPECTING JOB LISTINGS ON RESULTS PAGE")
-        print("-" * 80)
-        
-        job_listings_script = """
-        () => {
-            const results = {
-                articles: document.querySelectorAll('article').length,
-                jobListings: document.querySelectorAll('.job-listing').length,
-                jobItems: document.querySelectorAll('.job-item').length,
-                jobCards: document.querySelectorAll('.job-card').length,
-                dataJobId: document.querySelectorAll('[data-job-id]').length,
-                roleArticle: document.querySelectorAll('[role="article"]').length,
-                allDivs: document.querySelectorAll('div[class*="job"]').length,
-            };
-            
-            // Get sample structure of first few elements
-            const samples = [];
-            
-            // Try to find any job-related container
-            const possibleContainers = document.querySelectorAll('[class*="job"], [data-job], [class*="result"]');
-            
-            for (let i = 0; i < Math.min(3, possibleContainers.length); i++) {
-                const elem = possibleContainers[i];
-                samples.push({
-                    tagName: elem.tagName,
-                    className: elem.className,
-                    id: elem.id || 'N/A',
-                    dataAttributes: Array.from(elem.attributes)
-                        .filter(attr => attr.name.startsWith('data-'))
-                        .map(attr => `${attr.name}="${attr.value}"`).join(', ') || 'N/A',
-                    innerHTML: elem.innerHTML.substring(0, 200) + '...'
-                });
-            }
-            
-            return { counts: results, samples: samples };
-        }
-        """
-        
-        job_data = await page.evaluate(job_listings_script)
-        
-        print("\n📊 Job Listing Counts:")
-        for selector, count in job_data['counts'].items():
-            print(f"  {selector}: {count}")
-        
-        print("\n📝 Sample Job Elements (first 3):")
-        for idx, sample in enumerate(job_data['samples'], 1):
-            print(f"\nSample #{idx}:")
-            print(f"  Tag: {sample['tagName']}")
-            print(f"  Class: {sample['className']}")
-            print(f"  ID: {sample['id']}")
-            print(f"  Data Attributes: {sample['dataAttributes']}")
-            print(f"  Inner HTML Preview: {sample['innerHTML'][:150]}...")
-        
-        # Get detailed structure of first job listing
-        print("\n" + "-" * 80)
-        print("🔬 DETAILED STRUCTURE OF FIRST JOB LISTING")
-        print("-" * 80)
-        
-        detailed_job_script = """
-        () => {
-            // Find the most likely job container
-            const container = document.querySelector('[class*="job"]') || 
-                            document.querySelector('[data-job]') ||
-                            document.querySelector('article') ||
-                            document.querySelector('[class*="result"]');
-            
-            if (!container) return null;
-            
-            return {
-                outerHTML: container.outerHTML.substring(0, 500),
-                classes: container.className,
-                // Find title elements
-                titles: Array.from(container.querySelectorAll('h1, h2, h3, h4, h5, h6, [class*="title"]')).map(el => ({
-                    tag: el.tagName,
-                    class: el.className,
-                    text: el.textContent.trim().substring(0, 100)
-                })),
-                // Find location elements
-                locations: Array.from(container.querySelectorAll('[class*="location"], [class*="city"]')).map(el => ({
-                    tag: el.tagName,
-                    class: el.className,
-                    text: el.textContent.trim()
-                })),
-                // Find links
-                links: Array.from(container.querySelectorAll('a')).map(el => ({
-                    class: el.className,
-                    href: el.href,
-                    text: el.textContent.trim().substring(0, 50)
-                }))
-            };
-        }
-        """
-        
-        detailed_job = await page.evaluate(detailed_job_script)
-        
-        if detailed_job:
-            print("\n📦 Container:")
-            print(f"  Classes: {detailed_job['classes']}")
-            print(f"\n  HTML Preview:\n{detailed_job['outerHTML']}...\n")
-            
-            print("📌 Title Elements Found:")
-            for title in detailed_job['titles']:
-                print(f"  - {title['tag']}.{title['class']}: {title['text']}")
-            
-            print("\n📍 Location Elements Found:")
-            for loc in detailed_job['locations']:
-                print(f"  - {loc['tag']}.{loc['class']}: {loc['text']}")
-            
-            print("\n🔗 Links Found:")
-            for link in detailed_job['links'][:3]:  # First 3 links
-                print(f"  - {link['class']}: {link['text']}")
-                print(f"    URL: {link['href']}")
-        else:
-            print("\n⚠️  Could not find any job listing container!")
-        
-        print("\n" + "="*80)
-        print("🎯 RECOMMENDED SELECTORS")
-        print("="*80 + "\n")
-        
-        # Generate recommendations
-        if search_inputs:
-            print("Job Title Field:")
-            print(f"  Primary: #{search_inputs[0]['id']}")
-            print(f"  Backup: .{search_inputs[0]['class'].split()[0] if search_inputs[0]['class'] != 'N/A' else 'ms-SearchBox-field'}")
-        
-        if location_inputs:
-            print("\nLocation Field:")
-            print(f"  Primary: #{location_inputs[0]['id']}")
-            print(f"  Backup: input[placeholder*='{location_inputs[0]['placeholder'][:20]}']")
-        else:
-            print("\n⚠️  No location field - Microsoft might use a different approach")
-        
-        if detailed_job and detailed_job['classes']:
-            print("\nJob Listing Container:")
-            main_class = detailed_job['classes'].split()[0] if detailed_job['classes'] else 'unknown'
-            print(f"  Primary: .{main_class}")
-            print(f"  Backup: [class*='{main_class[:10]}']")
-        
-        print("\n" + "="*80)
-        print("✅ INSPECTION COMPLETE - Browser will stay open for 30 seconds")
-        print("   You can manually inspect elements if needed.")
-        print("="*80 + "\n")
+        logger.info("\n" + "="*80)
+        logger.info("✅ INSPECTION COMPLETE")
+        if INSPECT_HOLD_SECONDS > 0:
+            logger.info("   Browser will stay open for %g seconds", INSPECT_HOLD_SECONDS)
+            logger.info("   You can manually inspect elements if needed.")
+        logger.info("="*80 + "\n")
         
         # Keep browser open for inspection
-        await asyncio.sleep(30)
-        
-        await browser.close()
+        if INSPECT_HOLD_SECONDS > 0:
+            await asyncio.sleep(INSPECT_HOLD_SECONDS)
+
+
+async def main():
+    """Run the inspection and shut down the shared browser."""
+    try:
+        await inspect_page()
+    finally:
+        await browser_pool.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(inspect_page())
+    asyncio.run(main())
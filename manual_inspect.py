@@ -5,103 +5,84 @@ Opens browser, performs search, and pauses for manual inspection
 """
 
 import asyncio
-from playwright.async_api import async_playwright
+import os
+import shutil
+import signal
+import sys
 
+# Persistent Chromium profile, so the HTTP cache survives between runs
+USER_DATA_DIR = os.path.expanduser("~/.cache/job_scrapers/chromium")
+
+# Results page for the 'AI' search, loaded directly unless --interactive
+SEARCH_URL = "https://jobs.careers.microsoft.com/global/en/search?q=AI"
+
+# Results counter heading; any h1 mentioning results, since the homepage has
+# an h1 of its own that would otherwise satisfy the wait immediately
+RESULTS_COUNTER_SEL = 'h1:has-text("result")'
+
+# Resources not needed for inspecting the DOM, blocked via CDP
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif",
+    "*.woff*",
+    "*.mp4",
+    "*google-analytics*", "*doubleclick*", "*segment.io*", "*hotjar*",
+]
+
+# Element counter installed on every page as window.__jobCounts, so repeat
+# inspections call it by name instead of re-sending the source. Tallies every
+# counter in a single pass over the DOM.
+JOB_COUNTS_SCRIPT = """
+window.__jobCounts = () => {
+    const counts = {
+        'h1': 0, 'h2': 0, 'h3': 0, 'article': 0, 'li': 0, 'div': 0, 'a': 0,
+        '[role="listitem"]': 0,
+        '[data-job-id]': 0,
+    };
+    const tags = {H1: 'h1', H2: 'h2', H3: 'h3', ARTICLE: 'article', LI: 'li', DIV: 'div', A: 'a'};
+    const walker = document.createTreeWalker(document.documentElement, NodeFilter.SHOW_ELEMENT);
+    let node;
+    while ((node = walker.nextNode())) {
+        const key = tags[node.tagName];
+        if (key) counts[key]++;
+        if (node.getAttribute('role') === 'listitem') counts['[role="listitem"]']++;
+        if (node.hasAttribute('data-job-id')) counts['[data-job-id]']++;
+    }
+    // Only report what was found
+    return Object.fromEntries(Object.entries(counts).filter(([, count]) => count > 0));
+};
+"""
+
+# Terminal banners, each written in a single call
+_RULE = "=" * 80
+
+# Banner shown before the browser opens
+_INTRO = f"""
+{_RULE}
+MANUAL INSPECTION MODE
+{_RULE}
+
+This script will:
+1. Open Chrome browser
+2. Load the Microsoft Careers search results for 'AI'
+   (with --interactive: type 'AI' into the homepage search instead)
+3. Show results page
+4. PAUSE so you can inspect elements
+
+{_RULE}
+"""
+
+_RESULTS_HEADER = f"""
+{_RULE}
+RESULTS PAGE LOADED - READY FOR INSPECTION
+{_RULE}
+"""
+
+# How to inspect the results page by hand
+_INSTRUCTIONS = f"""
+{_RULE}
+INSPECTION INSTRUCTIONS
+{_RULE}
 
-async def manual_inspection():
-    """Open browser and pause for manual inspection."""
-    
-    print("\n" + "="*80)
-    print("MANUAL INSPECTION MODE")
-    print("="*80)
-    print("\nThis script will:")
-    print("1. Open Chrome browser")
-    print("2. Navigate to Microsoft Careers")
-    print("3. Fill in the search for 'AI'")
-    print("4. Show results page")
-    print("5. PAUSE so you can inspect elements\n")
-    print("="*80)
-    
-    async with async_playwright() as p:
-        # Launch visible browser
-        browser = await p.chromium.launch(
-            headless=False,
-            args=[
-                '--disable-notifications',
-                '--disable-popup-blocking',
-                '--start-maximized'
-            ]
-        )
-        
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            permissions=[],
-        )
-        
-        page = await context.new_page()
-        
-        # Step 1: Navigate
-        print("\n📍 Step 1: Navigating to Microsoft Careers...")
-        await page.goto("https://careers.microsoft.com/v2/global/en/home.html", 
-                       wait_until='networkidle')
-        await asyncio.sleep(3)
-        print("✅ Homepage loaded")
-        
-        # Step 2: Fill search
-        print("\n🔍 Step 2: Filling search box with 'AI'...")
-        try:
-            await page.fill('#search-box9', 'AI')
-            print("✅ Search box filled")
-        except Exception as e:
-            print(f"❌ Could not fill search box: {e}")
-        
-        await asyncio.sleep(2)
-        
-        # Step 3: Submit search
-        print("\n⏎ Step 3: Pressing Enter to search...")
-        await page.keyboard.press('Enter')
-        await page.wait_for_load_state('networkidle', timeout=30000)
-        await asyncio.sleep(5)
-        print("✅ Results page loaded")
-        
-        # Step 4: Show current state
-        print("\n" + "="*80)
-        print("RESULTS PAGE LOADED - READY FOR INSPECTION")
-        print("="*80)
-        
-        # Get results counter
-        try:
-            results_h1 = await page.evaluate("() => document.querySelector('h1')?.textContent")
-            print(f"\n📊 Results counter: {results_h1}")
-        except:
-            print("\n⚠️  Could not find results counter")
-        
-        # Quick element count
-        counts = await page.evaluate("""
-            () => {
-                return {
-                    'h1': document.querySelectorAll('h1').length,
-                    'h2': document.querySelectorAll('h2').length,
-                    'h3': document.querySelectorAll('h3').length,
-                    'article': document.querySelectorAll('article').length,
-                    'li': document.querySelectorAll('li').length,
-                    'div': document.querySelectorAll('div').length,
-                    'a': document.querySelectorAll('a').length,
-                    '[role="listitem"]': document.querySelectorAll('[role="listitem"]').length,
-                    '[data-job-id]': document.querySelectorAll('[data-job-id]').length,
-                };
-            }
-        """)
-        
-        print("\n📊 Element counts on page:")
-        for tag, count in counts.items():
-            if count > 0:
-                print(f"   {tag}: {count}")
-        
-        print("\n" + "="*80)
-        print("INSPECTION INSTRUCTIONS")
-        print("="*80)
-        print("""
 Now you can manually inspect the page:
 
 1. RIGHT-CLICK on a job title → Select "Inspect"
@@ -148,27 +129,22 @@ Now you can manually inspect the page:
    
    This will tell you how many elements match that selector.
 
-""")
-        
-        print("="*80)
-        print("⏸️  SCRIPT PAUSED - Browser will stay open")
-        print("="*80)
-        print("\nTake your time to inspect the elements.")
-        print("When done, press Ctrl+C in this terminal to close the browser.\n")
-        
-        try:
-            # Keep browser open until user interrupts
-            while True:
-                await asyncio.sleep(60)
-        except KeyboardInterrupt:
-            print("\n\n✅ Closing browser...")
-        
-        await browser.close()
-        
-        print("\n" + "="*80)
-        print("NEXT STEPS")
-        print("="*80)
-        print("""
+
+{_RULE}
+⏸️  SCRIPT PAUSED - Browser will stay open
+{_RULE}
+
+Take your time to inspect the elements.
+When done, press Ctrl+C in this terminal to close the browser.
+
+"""
+
+# What to report back after inspecting
+_NEXT_STEPS = f"""
+{_RULE}
+NEXT STEPS
+{_RULE}
+
 After inspecting, share what you found:
 
 1. Container selector (e.g., ".job-card", "[role='listitem']")
@@ -176,11 +152,159 @@ After inspecting, share what you found:
 3. Number of jobs found with that selector
 
 Then I'll update the scraper with the correct selectors!
-""")
+
+"""
+
+
+async def _wait_ready(page, timeout: float = 10.0, interval: float = 0.1):
+    """
+    Wait until the page has finished loading and stopped fetching resources.
+    
+    Args:
+        page: Playwright page to poll
+        timeout: Maximum seconds to wait before giving up
+        interval: Seconds between polls
+    
+    Ready means document.readyState is 'complete' and the number of resource
+    timing entries is unchanged across two consecutive polls.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    last_count = None
+    
+    while loop.time() - start < timeout:
+        state, count = await page.evaluate(
+            "() => [document.readyState, performance.getEntriesByType('resource').length]"
+        )
+        if state == 'complete' and count == last_count:
+            return
+        last_count = count
+        await asyncio.sleep(interval)
+
+
+async def manual_inspection(fresh: bool = False, interactive: bool = False):
+    """
+    Open browser and pause for manual inspection.
+    
+    Args:
+        fresh: Wipe the persistent profile first for an uncached run
+        interactive: Type the search into the homepage form instead of
+            loading the results URL directly
+    """
+    if fresh:
+        shutil.rmtree(USER_DATA_DIR, ignore_errors=True)
+    
+    sys.stdout.write(_INTRO)
+    sys.stdout.flush()
+    
+    # Imported here so the banner shows before Playwright's slow import
+    from playwright.async_api import async_playwright
+    
+    async with async_playwright() as p:
+        # Launch visible browser on the persistent profile (no page.route
+        # handlers here, since routing disables the HTTP cache)
+        context = await p.chromium.launch_persistent_context(
+            user_data_dir=USER_DATA_DIR,
+            headless=False,
+            no_viewport=True,  # render at the maximized window size
+            args=[
+                '--disable-notifications',
+                '--disable-popup-blocking',
+                '--start-maximized'
+            ]
+        )
+        await context.add_init_script(script=JOB_COUNTS_SCRIPT)
+        
+        # A persistent context starts with a blank tab already open
+        page = context.pages[0] if context.pages else await context.new_page()
+        
+        # Block via CDP rather than page.route, which would disable the HTTP cache
+        client = await context.new_cdp_session(page)
+        await client.send("Network.enable")
+        await client.send("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        
+        if interactive:
+            # Step 1: Navigate
+            print("\n📍 Step 1: Navigating to Microsoft Careers...")
+            await page.goto("https://careers.microsoft.com/v2/global/en/home.html", 
+                           wait_until='domcontentloaded')
+            await page.wait_for_selector('#search-box9', state='visible', timeout=15000)
+            print("✅ Homepage loaded")
+            
+            # Step 2: Fill search
+            print("\n🔍 Step 2: Filling search box with 'AI'...")
+            try:
+                await page.fill('#search-box9', 'AI')
+                print("✅ Search box filled")
+            except Exception as e:
+                print(f"❌ Could not fill search box: {e}")
+            
+            # Step 3: Submit search
+            print("\n⏎ Step 3: Pressing Enter to search...")
+            await page.keyboard.press('Enter')
+        else:
+            # Go straight to the results; one navigation instead of two
+            print("\n📍 Navigating to the search results for 'AI'...")
+            await page.goto(SEARCH_URL, wait_until='domcontentloaded')
+        await page.wait_for_selector(RESULTS_COUNTER_SEL, timeout=30000)
+        # The job list keeps filling in after the counter renders; let it
+        # settle so the element counts below reflect the whole page
+        await _wait_ready(page)
+        print("✅ Results page loaded")
+        
+        # Step 4: Show current state
+        sys.stdout.write(_RESULTS_HEADER)
+        sys.stdout.flush()
+        
+        # Get results counter and element counts in one round-trip
+        try:
+            data = await page.evaluate("""
+                () => ({
+                    h1Text: [...document.querySelectorAll('h1')].find(h => /result/i.test(h.textContent))?.textContent,
+                    counts: window.__jobCounts(),
+                })
+            """)
+            print(f"\n📊 Results counter: {data['h1Text']}")
+            counts = data['counts']
+        except Exception:
+            print("\n⚠️  Could not read results counter or element counts")
+            counts = {}
+        
+        print("\n📊 Element counts on page:")
+        for tag, count in counts.items():
+            print(f"   {tag}: {count}")
+        
+        sys.stdout.write(_INSTRUCTIONS)
+        sys.stdout.flush()
+        
+        # Keep browser open until user interrupts; Ctrl+C sets the event so
+        # shutdown runs without unwinding through a KeyboardInterrupt
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, stop.set)
+        except NotImplementedError:  # Windows: fall back to KeyboardInterrupt
+            pass
+        
+        try:
+            await stop.wait()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+        finally:
+            try:
+                loop.remove_signal_handler(signal.SIGINT)
+            except NotImplementedError:
+                pass
+        print("\n\n✅ Closing browser...")
+        
+        await context.close()
+        
+        sys.stdout.write(_NEXT_STEPS)
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(manual_inspection())
+        asyncio.run(manual_inspection(fresh='--fresh' in sys.argv, interactive='--interactive' in sys.argv))
     except KeyboardInterrupt:
         print("\n\n👋 Manual inspection ended")
@@ -5,21 +5,56 @@ with human-like behavior and backoff strategies.
 """
 
 import asyncio
+import html
+import importlib.util
+import json
 import random
+import re
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime
+import os
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import List, Dict, Optional, Sequence, Tuple, Union
+from datetime import datetime, timezone
 from pathlib import Path
 
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Response, Error as PlaywrightError, TimeoutError as PlaywrightTimeout
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
     before_sleep_log
 )
-import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # optional: only needed for the search API fast path
+    httpx = None
+
+from browser_pool import RetryAfterTracker, parse_retry_after
+from config import (
+    AIMD_CONFIG,
+    BROWSER_CONFIG,
+    CACHE_CONFIG,
+    OUTPUT_CONFIG,
+    SCRAPER_CONFIG,
+    SELECTORS,
+    compile_selector,
+    make_output_paths
+)
+from output import SCHEMA, save_jobs, write_jobs, write_json
+from rate_limit import AIMDController, HostRateLimiter
+from retry import retry_async
+from scrape_cache import ScrapeCache
 
 
 # Configure logging
@@ -30,95 +65,504 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Requests the scraper never needs: it reads text only, but keeps CSS since
+# layout affects selector resolution (e.g. visibility checks)
+BLOCKED_RESOURCE_TYPES = frozenset(BROWSER_CONFIG['block_resource_types'])
+BLOCKED_URL_PARTS = ('google-analytics', 'doubleclick', 'googletagmanager', 'bat.bing', 'clarity.ms')
+
+
+async def _block_handler(route):
+    """Abort images, fonts, media and tracker requests."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _block_with_styles_handler(route):
+    """Like _block_handler, but also abort stylesheets."""
+    if route.request.resource_type == 'stylesheet':
+        await route.abort()
+    else:
+        await _block_handler(route)
+
+
+# Dedicated generator for human-behavior jitter
+_RNG = random.Random()
+
+# Anti-detection shims installed on every page of the scraper context
+STEALTH_SCRIPT_PATH = Path(__file__).parent / 'scripts' / 'stealth.js'
+
+# Chromium flags that cut renderer memory: fewer helper processes, a capped
+# V8 heap and no GPU process. Only applied headless, since a visible window
+# needs the GPU and per-site renderers to behave like a normal browser.
+HEADLESS_MEMORY_ARGS = (
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--disable-extensions',
+    '--disable-sync',
+    '--disable-translate',
+    # Chromium only honors the last --disable-features, so keep them in one flag
+    '--disable-features=site-per-process,IsolateOrigins,TranslateUI',
+    '--renderer-process-limit=2',
+    '--js-flags=--max-old-space-size=256',
+    '--disable-background-networking',
+    '--disable-breakpad',
+)
+
+# Fallback selector lists, in priority order, from the single source in config
+COOKIE_SELECTORS = SELECTORS['cookie_consent']
+JOB_TITLE_SELECTORS = SELECTORS['job_title_input']
+LOCATION_SELECTORS = SELECTORS['location_input']
+SEARCH_BUTTON_SELECTORS = SELECTORS['search_button']
+LISTING_SELECTORS = SELECTORS['job_listings']
+
+# Per-field selectors tried in order inside each job card (see EXTRACT_JOBS_SCRIPT)
+JOB_FIELD_SELECTORS = {
+    'title': SELECTORS['job_title'],
+    'job_location': SELECTORS['job_location'],
+    'posted_date': SELECTORS['job_date'],
+    'description': SELECTORS['job_description'],
+}
+
+
+# Extracts all job cards in-page and returns them as a JSON string. Each field
+# takes the first selector whose match has text (descriptions need more than
+# 20 characters), mirroring the per-selector fallback order.
+EXTRACT_JOBS_SCRIPT = r"""
+    ({selector, byJobLink, maxJobs, fields, jobLinkSelector, jobIdPattern}) => {
+        let containers;
+        if (byJobLink) {
+            // Parents of job links are likely the job containers
+            const links = Array.from(document.querySelectorAll(jobLinkSelector));
+            containers = links.slice(0, 50).map(a => a.closest('li, div, article')).filter(Boolean);
+            if (!containers.length) containers = links;
+        } else {
+            containers = Array.from(document.querySelectorAll(selector));
+        }
+        
+        const firstText = (el, selectors, minLength) => {
+            for (const sel of selectors) {
+                try {
+                    const text = el.querySelector(sel)?.textContent?.trim();
+                    if (text && text.length > minLength) return text;
+                } catch (e) {
+                    // Selector not supported here, try the next one
+                }
+            }
+            return null;
+        };
+        
+        const JOB_ITEM_RE = new RegExp(jobIdPattern);
+        const JOB_PATH_RE = /\/jobs?\/(\d+)/;
+        
+        const rows = [];
+        for (const el of containers.slice(0, maxJobs)) {
+            const row = {
+                title: firstText(el, fields.title, 0) || 'N/A',
+                job_location: firstText(el, fields.job_location, 0) || 'N/A',
+            };
+            
+            // Job ID from aria-label (e.g., "Job item 1827725") on the
+            // container or a child div, else from the first link's path
+            const labelled = JOB_ITEM_RE.exec(el.getAttribute('aria-label') || '') ||
+                JOB_ITEM_RE.exec(el.querySelector('div[aria-label*="Job item"]')?.getAttribute('aria-label') || '');
+            const link = el.matches('a') ? el : el.querySelector('a');
+            row.job_id = 'N/A';
+            if (labelled) {
+                row.job_id = labelled[1];
+                row.url = `https://careers.microsoft.com/us/en/job/${row.job_id}`;
+            } else if (link) {
+                const href = link.getAttribute('href');
+                if (!href) {
+                    row.url = 'N/A';
+                } else if (href.startsWith('/')) {
+                    row.url = `https://careers.microsoft.com${href}`;
+                } else {
+                    row.url = href;
+                }
+                row.job_id = JOB_PATH_RE.exec(href || '')?.[1] || 'N/A';
+            } else {
+                const jobId = el.getAttribute('data-job-id');
+                row.url = jobId ? `https://careers.microsoft.com/job/${jobId}` : 'N/A';
+                row.job_id = jobId || 'N/A';
+            }
+            
+            row.posted_date = firstText(el, fields.posted_date, 0) || 'N/A';
+            
+            // Fallback: all text from the element
+            row.description = firstText(el, fields.description, 20) ||
+                (el.textContent || '').trim().substring(0, 500) || 'N/A';
+            
+            rows.push(row);
+        }
+        return JSON.stringify(rows);
+    }
+"""
+
+
 class HumanBehavior:
-    """Simulates human-like behavior for web scraping."""
+    """
+    Simulates human-like behavior for web scraping.
+    
+    Pass stealth=False to skip the delays and send input straight through,
+    which is all headless runs need.
+    """
+    
+    # Set SCRAPER_FAST_INPUT=1 (as run_tests does) to always fill fields in
+    # one call, even where stealth typing was requested
+    FAST = bool(os.environ.get('SCRAPER_FAST_INPUT'))
     
     @staticmethod
-    async def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0):
-        """Add random delay to simulate human reading time."""
-        delay = random.uniform(min_seconds, max_seconds)
+    async def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0, stealth: bool = True):
+        """Add random delay to simulate human reading time (no-op unless stealth)."""
+        if not stealth:
+            return
+        delay = _RNG.uniform(min_seconds, max_seconds)
         logger.debug(f"Waiting {delay:.2f} seconds")
         await asyncio.sleep(delay)
     
     @staticmethod
-    async def human_type(page: Page, selector: str, text: str):
-        """Type text character by character with random delays."""
-        await page.click(selector)
+    async def human_type(page: Page, selector: str, text: str, stealth: bool = False):
+        """
+        Enter text into a field.
+        
+        Args:
+            page: Playwright page object
+            selector: Selector of the field to type into
+            text: Text to enter
+            stealth: Type character by character with random delays, for
+                sites that check keystroke timing (default: fill in one call)
+        """
+        if not stealth or HumanBehavior.FAST:
+            await page.fill(selector, text)
+            return
+        
+        field = page.locator(selector)
+        await field.click()
         await HumanBehavior.random_delay(0.3, 0.8)
         
-        for char in text:
-            await page.type(selector, char)
-            await asyncio.sleep(random.uniform(0.05, 0.15))
+        # Per-keystroke delay is applied browser-side in a single command
+        await field.press_sequentially(text, delay=_RNG.randint(50, 150))
         
         await HumanBehavior.random_delay(0.5, 1.0)
     
     @staticmethod
-    async def human_click(page: Page, selector: str):
-        """Click with human-like delay."""
-        await HumanBehavior.random_delay(0.5, 1.5)
+    async def human_click(page: Page, selector: str, stealth: bool = True):
+        """Click with human-like delay (plain click unless stealth)."""
+        await HumanBehavior.random_delay(0.5, 1.5, stealth)
         await page.click(selector)
-        await HumanBehavior.random_delay(1.0, 2.0)
+        await HumanBehavior.random_delay(1.0, 2.0, stealth)
     
     @staticmethod
-    async def random_mouse_movement(page: Page):
-        """Simulate random mouse movements."""
+    async def random_mouse_movement(page: Page, stealth: bool = True):
+        """Simulate random mouse movements (no-op unless stealth)."""
         viewport = page.viewport_size
-        if viewport:
-            x = random.randint(0, viewport['width'])
-            y = random.randint(0, viewport['height'])
+        if stealth and viewport:
+            x = _RNG.randint(0, viewport['width'])
+            y = _RNG.randint(0, viewport['height'])
             await page.mouse.move(x, y)
             await HumanBehavior.random_delay(0.2, 0.5)
 
 
+async def wait_for_request_quiet(page: Page, quiet: float = 0.5, timeout: float = 10.0) -> bool:
+    """
+    Wait until the page has no requests in flight for `quiet` seconds.
+    
+    A bounded stand-in for networkidle, which may never fire on pages that
+    keep analytics or socket traffic open. Only requests started after the
+    call are tracked.
+    
+    Args:
+        page: Playwright page object
+        quiet: Seconds without pending requests that count as settled
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        True if the page settled, False if the timeout was reached
+    """
+    loop = asyncio.get_running_loop()
+    pending = set()
+    last_change = loop.time()
+    
+    def on_request(request):
+        nonlocal last_change
+        pending.add(request)
+        last_change = loop.time()
+    
+    def on_done(request):
+        nonlocal last_change
+        pending.discard(request)
+        last_change = loop.time()
+    
+    page.on("request", on_request)
+    page.on("requestfinished", on_done)
+    page.on("requestfailed", on_done)
+    try:
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            if not pending and loop.time() - last_change >= quiet:
+                return True
+            await asyncio.sleep(0.05)
+        return False
+    finally:
+        page.remove_listener("request", on_request)
+        page.remove_listener("requestfinished", on_done)
+        page.remove_listener("requestfailed", on_done)
+
+
+# Reports, in one round-trip, whether each selector matches anything: true or
+# false for plain CSS, null for Playwright-only syntax (e.g. :has-text) that
+# document.querySelector rejects
+PRESENT_SELECTORS_SCRIPT = """
+    sels => sels.map(sel => {
+        try {
+            return document.querySelector(sel) !== null;
+        } catch (e) {
+            return null;
+        }
+    })
+"""
+
+
+async def matching_selectors(page: Page, selectors: Sequence[str]) -> List[str]:
+    """
+    Return the selectors that match anything on the page, in priority order.
+    
+    Plain CSS selectors are all checked in-page by a single evaluate; only
+    Playwright-specific ones fall back to locator counts, run concurrently.
+    
+    Args:
+        page: Playwright page object
+        selectors: Candidate selectors in priority order
+        
+    Returns:
+        Selectors with at least one match, in the order given
+    """
+    present = await page.evaluate(PRESENT_SELECTORS_SCRIPT, list(selectors))
+    
+    engine_only = [selector for selector, found in zip(selectors, present) if found is None]
+    if engine_only:
+        counts = await asyncio.gather(
+            *(page.locator(selector).count() for selector in engine_only),
+            return_exceptions=True
+        )
+        engine_found = {}
+        for selector, count in zip(engine_only, counts):
+            if isinstance(count, Exception):
+                logger.debug(f"Selector {selector} failed: {count}")
+                count = 0
+            engine_found[selector] = count > 0
+        present = [engine_found[selector] if found is None else found for selector, found in zip(selectors, present)]
+    
+    return [selector for selector, found in zip(selectors, present) if found]
+
+
+async def first_matching(page: Page, selectors: Sequence[str]) -> Optional[str]:
+    """Return the highest-priority selector that matches anything, or None."""
+    matches = await matching_selectors(page, selectors)
+    return matches[0] if matches else None
+
+
 class MicrosoftCareersScraper:
-    """Scraper for Microsoft Careers website."""
+    """
+    Scraper for Microsoft Careers website.
+    
+    scrape() runs one search and scrape_many() runs several concurrently
+    through it. Either way a fresh cached result is used first, then the
+    search API (use_api=True), then the browser.
+    """
     
     BASE_URL = "https://careers.microsoft.com/v2/global/en/home.html"
     
-    def __init__(self, headless: bool = False):
+    # Backend the careers site's own search page calls for results
+    API_URL = "https://gcsservices.careers.microsoft.com/search/api/v1/search"
+    API_JOB_URL = "https://gcsservices.careers.microsoft.com/search/api/v1/job/{job_id}"
+    API_PAGE_SIZE = 20
+    # In-memory LRU of raw search API pages, keyed by (q, lc, pg)
+    API_CACHE_SIZE = 512
+    API_CACHE_TTL = 300.0
+    JOB_URL = "https://jobs.careers.microsoft.com/global/en/job/{job_id}"
+    
+    # Any job title input, compiled at import for the search form wait
+    JOB_TITLE_SEL = compile_selector(JOB_TITLE_SELECTORS)
+    
+    # Page-load and results waits
+    SEARCH_BOX_SEL = '#search-box9, input.ms-SearchBox-field'
+    RESULTS_COUNTER_SEL = 'h1:has-text("results"), h1:has-text("result")'
+    FIRST_CARD_SEL = '[role=listitem], article'
+    JOB_CARD_SEL = 'div[role="listitem"].ms-List-cell'
+    ANY_LISTITEM_SEL = '[role="listitem"]'
+    JOB_LINK_SEL = 'a[href*="/job/"]'
+    
+    # Job ID in a card's aria-label (e.g. "Job item 1827725"); the pattern is
+    # also handed to EXTRACT_JOBS_SCRIPT, so keep it valid JavaScript regex
+    JOB_ID_RE = re.compile(r"Job item (\d+)")
+    
+    # How long a late consent banner is waited for on a cold context
+    COOKIE_TIMEOUT_MS = 500
+    
+    USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    
+    def __init__(
+        self,
+        headless: bool = SCRAPER_CONFIG['headless'],
+        pool_size: int = 1,
+        cache_ttl: float = CACHE_CONFIG['ttl_s'],
+        storage_state: Optional[Union[str, Path]] = CACHE_CONFIG['storage_state'],
+        stealth: Optional[bool] = None,
+        use_api: bool = False,
+        fetch_details: bool = False,
+        block_stylesheets: bool = False,
+        max_pages: int = 4,
+        output_dir: Union[str, Path] = OUTPUT_CONFIG['directory']
+    ):
         """
         Initialize the scraper.
         
         Args:
-            headless: Whether to run browser in headless mode (default: False)
+            headless: Whether to run browser in headless mode (default from config)
+            pool_size: Number of pages kept open for reuse across searches
+            cache_ttl: Seconds to reuse a previous result for the same search
+                (default from config: 0, which disables the result cache)
+            storage_state: File to load cookies from and save them to once
+                cookie consent is accepted (None or '' to disable)
+            stealth: Use human-like delays and per-keystroke typing
+                (default: only when not headless)
+            use_api: Query the site's JSON search API first and only fall
+                back to the browser if that fails (requires httpx)
+            fetch_details: Replace each scraped description with the full
+                text from the job-detail API (requires httpx)
+            block_stylesheets: Also abort CSS downloads (images, fonts, media
+                and trackers are always blocked); off by default because
+                visibility checks depend on styles
+            max_pages: Maximum number of pages scraping at once across all
+                scrape()/scrape_many() calls
+            output_dir: Directory for save_to_csv()/save_to_json() files
         """
         self.headless = headless
+        # Human-like delays only matter when someone (or something) is watching
+        self.stealth = not headless if stealth is None else stealth
+        self.pool_size = pool_size
+        self.use_api = use_api
+        self.fetch_details = fetch_details
+        self.block_stylesheets = block_stylesheets
+        self.cache = ScrapeCache(CACHE_CONFIG['path'], cache_ttl) if cache_ttl > 0 else None
         self.browser: Optional[Browser] = None
         self.jobs: List[Dict] = []
+        self._page_pool: Optional[asyncio.Queue] = None
+        self.controller = AIMDController(**AIMD_CONFIG)
+        self.host_limiter = HostRateLimiter()
+        # Each open page holds a renderer process, so bound them per scraper
+        self.page_sem = asyncio.Semaphore(max_pages)
+        # Created on first save rather than here, so merely constructing a
+        # scraper doesn't touch the filesystem
+        self.output_dir = Path(output_dir)
+        self._output_cfg = dict(OUTPUT_CONFIG, directory=str(self.output_dir))
+        # HTTP client for the search and job-detail APIs, opened on first use
+        # inside an `async with` session and kept until it exits
+        self._http = None
+        self._in_session = False
+        self._api_pages: OrderedDict = OrderedDict()
+        self.storage_state_path = Path(storage_state) if storage_state else None
+        # Contexts restored from storage_state already have consent cookies
+        self._warm_contexts: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+        self._state_saved = False
     
-    async def initialize_browser(self):
-        """Initialize Playwright browser with human-like settings."""
-        self.playwright = await async_playwright().start()
+    async def __aenter__(self):
+        """Start the browser once for any number of scrape() calls."""
+        self._in_session = True
+        await self.initialize_browser()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared browser and API client (if one was opened)."""
+        self._in_session = False
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        await self.close_browser()
+    
+    @staticmethod
+    def launch_args(headless: bool) -> List[str]:
+        """
+        Chromium command-line arguments for the scraper.
         
-        # Launch browser with realistic viewport and user agent
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-notifications',  # Disable notification prompts
-                '--disable-popup-blocking',
-                '--disable-infobars',
-            ]
-        )
+        Args:
+            headless: Whether the browser will run headless
+            
+        Returns:
+            List of Chromium flags
+        """
+        args = [
+            '--disable-blink-features=AutomationControlled',
+            '--disable-dev-shm-usage',
+            '--no-sandbox',
+            '--disable-notifications',  # Disable notification prompts
+            '--disable-popup-blocking',
+            '--disable-infobars',
+        ]
+        if headless:
+            args += HEADLESS_MEMORY_ARGS
+            if sys.platform.startswith('linux'):
+                args.append('--no-zygote')  # Linux-only; relies on --no-sandbox
+        return args
+    
+    async def new_context(self, browser: Browser) -> BrowserContext:
+        """
+        Create a browser context with the scraper's settings.
+        
+        Args:
+            browser: Running browser to create the context on
+            
+        Returns:
+            New BrowserContext (caller is responsible for closing it)
+        """
+        warm = self.storage_state_path is not None and self.storage_state_path.exists()
         
         # Create context with realistic settings and block notifications
-        self.context = await self.browser.new_context(
+        context = await browser.new_context(
+            storage_state=str(self.storage_state_path) if warm else None,
             viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            user_agent=self.USER_AGENT,
             locale='en-US',
             timezone_id='America/Los_Angeles',
             permissions=[],  # Don't grant any permissions
             ignore_https_errors=True,
+            service_workers='allow',  # Let the site's service worker serve repeat loads
         )
         
+        # Skip downloads that don't affect the page text
+        await context.route("**/*", _block_with_styles_handler if self.block_stylesheets else _block_handler)
+        
+        # Feed server cooldowns into the navigation controller
+        context.on("response", self._observe_response)
+        
         # Additional anti-detection measures
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        await context.add_init_script(path=STEALTH_SCRIPT_PATH)
+        
+        if warm:
+            self._warm_contexts.add(context)
+        return context
+    
+    async def initialize_browser(self):
+        """Initialize Playwright browser with human-like settings."""
+        self.playwright = await async_playwright().start()
+        
+        # Launch browser with realistic viewport and user agent
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=self.launch_args(self.headless)
+        )
+        self.context = await self.new_context(self.browser)
+        
+        # Pre-open pages that scrape() borrows and returns
+        self._page_pool = asyncio.Queue()
+        for _ in range(self.pool_size):
+            page = await self.context.new_page()
+            await self.setup_dialog_handlers(page)
+            self._page_pool.put_nowait(page)
         
         logger.info("Browser initialized successfully")
     
@@ -136,16 +580,28 @@ class MicrosoftCareersScraper:
         page.on("dialog", handle_dialog)
         logger.info("Dialog handlers registered")
     
+    def _observe_response(self, response: Response):
+        """Back off the navigation controller on 429/503 with Retry-After."""
+        if response.status not in RetryAfterTracker.RETRY_STATUSES:
+            return
+        seconds = parse_retry_after(response.headers.get('retry-after'))
+        if seconds is not None:
+            logger.warning(f"HTTP {response.status} from {response.url}, Retry-After {seconds:.0f}s")
+            self.controller.retry_after(seconds)
+    
     async def close_browser(self):
         """Close browser and cleanup resources."""
         if self.browser:
             await self.browser.close()
             await self.playwright.stop()
+            self.browser = None
+            self._page_pool = None
             logger.info("Browser closed")
     
+    # Final safety net; pacing and backoff are handled by self.controller
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=4, max=30),
+        wait=wait_random_exponential(multiplier=0.5, min=0.5, max=10),
         retry=retry_if_exception_type(PlaywrightTimeout),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
@@ -162,15 +618,16 @@ class MicrosoftCareersScraper:
         logger.info(f"Navigating to {self.BASE_URL}")
         
         try:
-            await page.goto(self.BASE_URL, wait_until='networkidle', timeout=30000)
-            await HumanBehavior.random_delay(2, 4)
-            
-            # Wait for page to be interactive
-            await page.wait_for_load_state('domcontentloaded')
+            async with self.controller.admit():
+                await page.goto(self.BASE_URL, wait_until='domcontentloaded', timeout=30000)
+                
+                # Wait for the search box rather than for the network to go idle
+                await page.wait_for_selector(self.SEARCH_BOX_SEL, timeout=15000)
+            await HumanBehavior.random_delay(2, 4, stealth=self.stealth)
             
             logger.info("Successfully loaded homepage")
             return True
-            
+        
         except PlaywrightTimeout:
             logger.error("Timeout loading homepage")
             raise
@@ -180,31 +637,58 @@ class MicrosoftCareersScraper:
     
     async def handle_cookie_consent(self, page: Page):
         """Handle cookie consent popup if present."""
+        # Consent cookies came with the context's storage_state
+        if page.context in self._warm_contexts:
+            return
+        
         try:
-            # Look for common cookie consent selectors
-            cookie_selectors = [
-                'button:has-text("Accept")',
-                'button:has-text("Accept all")',
-                'button:has-text("I agree")',
-                '#cookie-banner button',
-            ]
-            
-            for selector in cookie_selectors:
-                try:
-                    if await page.locator(selector).count() > 0:
-                        await HumanBehavior.human_click(page, selector)
-                        logger.info("Cookie consent accepted")
-                        return
-                except Exception:
-                    continue
-                    
+            # The banner can render after the search box, so wait for any button
+            # briefly rather than checking once (or polling is_visible in a loop)
+            buttons = [page.locator(selector) for selector in COOKIE_SELECTORS]
+            any_button = buttons[0]
+            for button in buttons[1:]:
+                any_button = any_button.or_(button)
+            await any_button.first.wait_for(state='visible', timeout=self.COOKIE_TIMEOUT_MS)
+            
+            # Click the highest-priority visible button, not the first in document order
+            visible = await asyncio.gather(*(button.first.is_visible() for button in buttons))
+            selector = next(sel for sel, shown in zip(COOKIE_SELECTORS, visible) if shown)
+            await HumanBehavior.human_click(page, f"{selector} >> visible=true", stealth=self.stealth)
+            logger.info("Cookie consent accepted")
+            await self._save_storage_state(page.context)
+        
         except Exception as e:
             logger.debug(f"No cookie consent found or error handling it: {e}")
     
+    async def _save_storage_state(self, context: BrowserContext):
+        """Persist the context's cookies once, so later runs start with consent given."""
+        if self.storage_state_path is None or self._state_saved:
+            return
+        # Claimed before the write, so concurrent searches don't all write the file
+        self._state_saved = True
+        try:
+            await context.storage_state(path=self.storage_state_path)
+            logger.info(f"Saved browser storage state to {self.storage_state_path}")
+        except Exception as e:
+            self._state_saved = False
+            logger.debug(f"Could not save storage state: {e}")
+    
+    async def _enter_text(self, page: Page, selector: str, text: str):
+        """Replace a field's value: one fill, or clear and type it out in stealth mode."""
+        if not self.stealth:
+            await page.fill(selector, text)
+            return
+        
+        # Clear any existing value first
+        await page.fill(selector, '')
+        await HumanBehavior.random_delay(0.3, 0.8)
+        await HumanBehavior.human_type(page, selector, text, stealth=True)
+    
+    # Final safety net for browser errors only; a missing selector isn't retried
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=4, max=30),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_random_exponential(multiplier=0.5, min=0.5, max=10),
+        retry=retry_if_exception_type((PlaywrightTimeout, PlaywrightError)),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
     async def search_jobs(self, page: Page, job_title: str = "AI", location: str = "Seattle") -> bool:
@@ -221,121 +705,74 @@ class MicrosoftCareersScraper:
         """
         logger.info(f"Searching for '{job_title}' jobs in '{location}'")
         
-        try:
-            # Wait for search form to be visible with more specific selectors
-            await page.wait_for_selector('#search-box9, input[placeholder*="job title"], input[aria-label*="job title"], .ms-SearchBox-field', timeout=15000)
-            await HumanBehavior.random_delay(1, 2)
-            
-            # Find and fill job title field - prioritize the actual ID from the page
-            job_title_selectors = [
-                '#search-box9',  # Specific ID from Microsoft Careers
-                'input.ms-SearchBox-field',  # Class name from the actual page
-                'input[placeholder*="keyword"]',
-                'input[placeholder*="job title"]',
-                'input[aria-label*="job title"]',
-                'input[aria-label*="keyword"]',
-                'input[role="searchbox"]',
-                'input[type="search"]',
-                '#keyword',
-            ]
-            
-            job_field_found = False
-            for selector in job_title_selectors:
-                try:
-                    if await page.locator(selector).count() > 0:
-                        logger.info(f"Found job title field: {selector}")
-                        # Clear any existing value first
-                        await page.fill(selector, '')
-                        await HumanBehavior.random_delay(0.3, 0.8)
-                        # Type the search term
-                        await HumanBehavior.human_type(page, selector, job_title)
-                        job_field_found = True
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
-            
-            if not job_field_found:
-                logger.error("Could not find job title input field")
-                return False
-            
-            # Find and fill location field
-            location_selectors = [
-                'input#location-box9',  # Specific ID pattern (matching search-box9 pattern)
-                'input[id*="location"]',  # Any input with 'location' in ID
-                'input[placeholder*="location"]',
-                'input[aria-label*="location"]',
-                'input[placeholder*="city"]',
-                'input[placeholder*="where"]',
-                'input[name*="location"]',
-                '#location',
-            ]
-            
-            location_field_found = False
-            for selector in location_selectors:
-                try:
-                    if await page.locator(selector).count() > 0:
-                        logger.info(f"Found location field: {selector}")
-                        # Clear and fill location field
-                        await page.fill(selector, '')
-                        await HumanBehavior.random_delay(0.3, 0.8)
-                        await HumanBehavior.human_type(page, selector, location)
-                        location_field_found = True
-                        await HumanBehavior.random_delay(1, 2)
-                        break
-                except Exception as e:
-                    logger.debug(f"Location selector {selector} failed: {e}")
-                    continue
-            
-            if not location_field_found:
-                logger.warning("Could not find location input field, continuing anyway")
-            
-            # Click search/find button
-            search_button_selectors = [
-                'button:has-text("Find")',
-                'button:has-text("Search")',
-                'button[type="submit"]',
-                'input[type="submit"]',
-                '.search-button',
-            ]
-            
+        # Wait for search form to be visible with more specific selectors
+        await page.wait_for_selector(self.JOB_TITLE_SEL, timeout=15000)
+        await HumanBehavior.random_delay(1, 2, stealth=self.stealth)
+        
+        # Find and fill job title field - prioritize the actual ID from the page
+        selector = await first_matching(page, JOB_TITLE_SELECTORS)
+        if not selector:
+            logger.error("Could not find job title input field")
+            return False
+        
+        logger.info(f"Found job title field: {selector}")
+        await self._enter_text(page, selector, job_title)
+        
+        # Find and fill location field
+        selector = await first_matching(page, LOCATION_SELECTORS)
+        if selector:
+            logger.info(f"Found location field: {selector}")
+            await self._enter_text(page, selector, location)
+            await HumanBehavior.random_delay(1, 2, stealth=self.stealth)
+        else:
+            logger.warning("Could not find location input field, continuing anyway")
+        
+        # Click search/find button
+        selector = await first_matching(page, SEARCH_BUTTON_SELECTORS)
+        async with self.controller.admit():
             button_found = False
-            for selector in search_button_selectors:
+            if selector:
                 try:
-                    if await page.locator(selector).count() > 0:
-                        logger.info(f"Found search button: {selector}")
-                        await HumanBehavior.human_click(page, selector)
-                        button_found = True
-                        break
-                except Exception:
-                    continue
+                    logger.info(f"Found search button: {selector}")
+                    await HumanBehavior.human_click(page, selector, stealth=self.stealth)
+                    button_found = True
+                except Exception as e:
+                    logger.debug(f"Search button {selector} failed: {e}")
             
             if not button_found:
                 # Try pressing Enter as fallback
                 logger.info("Search button not found, trying Enter key")
                 await page.keyboard.press('Enter')
             
-            # Wait for results to load
-            await page.wait_for_load_state('networkidle', timeout=20000)
-            await HumanBehavior.random_delay(2, 4)
-            
-            logger.info("Search completed successfully")
-            return True
-            
-        except PlaywrightTimeout:
-            logger.error("Timeout during job search")
-            raise
-        except Exception as e:
-            logger.error(f"Error searching for jobs: {e}")
-            raise
+            # Wait for the results counter (any h1, not just the first), then
+            # for the first card
+            await page.wait_for_selector(self.RESULTS_COUNTER_SEL, timeout=8000)
+            try:
+                await page.wait_for_selector(self.FIRST_CARD_SEL, timeout=5000)
+            except PlaywrightTimeout:
+                # Let in-flight result requests finish rather than fail the search
+                logger.warning("Results counter shown but no job cards yet, waiting for requests to settle")
+                await wait_for_request_quiet(page, timeout=5.0)
+        await HumanBehavior.random_delay(2, 4, stealth=self.stealth)
+        
+        logger.info("Search completed successfully")
+        return True
     
-    async def scrape_job_listings(self, page: Page, max_jobs: int = 50) -> List[Dict]:
+    async def scrape_job_listings(
+        self,
+        page: Page,
+        max_jobs: int = 50,
+        search_term: str = "AI",
+        location: str = "Seattle"
+    ) -> List[Dict]:
         """
         Scrape job listings from search results.
         
         Args:
             page: Playwright page object
             max_jobs: Maximum number of jobs to scrape
+            search_term: Search term recorded on each job
+            location: Search location recorded on each job
             
         Returns:
             List of job dictionaries
@@ -349,391 +786,543 @@ class MicrosoftCareersScraper:
             
             # First, wait for results indicator
             try:
-                await page.wait_for_selector('h1:has-text("results"), h1:has-text("result")', timeout=10000)
+                await page.wait_for_selector(self.RESULTS_COUNTER_SEL, timeout=10000)
                 logger.info("Results counter found - jobs should be present")
-                await HumanBehavior.random_delay(2, 3)  # Extra wait for dynamic content
+                # One reading pause for the whole page (stealth only); the
+                # card waits below handle the dynamic content
+                await HumanBehavior.random_delay(0.5, 2.0, stealth=self.stealth)
             except Exception:
                 logger.warning("Results counter not found, continuing anyway")
             
-            # Wait for the specific job listing structure
+            # Wait for the specific job listing structure, or any list item;
+            # or_() races both in one wait instead of trying them in turn
+            listing = page.locator(self.JOB_CARD_SEL).or_(page.locator(self.ANY_LISTITEM_SEL))
             try:
-                await page.wait_for_selector('div[role="listitem"].ms-List-cell', timeout=15000)
+                await listing.first.wait_for(state='attached', timeout=15000)
                 logger.info("Found job listing elements")
-            except Exception:
-                logger.warning("Could not find job listing elements, trying alternative selector")
-                try:
-                    await page.wait_for_selector('[role="listitem"]', timeout=10000)
-                    logger.info("Found elements with alternative selector")
-                except Exception:
-                    logger.warning("Could not find any expected job listing elements")
+            except PlaywrightTimeout:
+                logger.warning("Could not find any expected job listing elements")
                 # Log page structure for debugging
-                html_snippet = await page.evaluate("() => document.body.innerHTML.substring(0, 2000)")
-                logger.debug(f"Page HTML preview: {html_snippet}")
-            
-            await HumanBehavior.random_delay(2, 3)
+                if logger.isEnabledFor(logging.DEBUG):
+                    html_snippet = await page.evaluate("() => document.body.innerHTML.substring(0, 2000)")
+                    logger.debug(f"Page HTML preview: {html_snippet}")
             
             # Try comprehensive list of selectors for job listings
-            listing_selectors = [
-                'div.ms-List-cell[role="listitem"]',  # ⭐ ACTUAL SELECTOR from inspection
-                '[role="listitem"].ms-List-cell',  # Alternative format
-                '.ms-List-cell',  # Microsoft Fabric UI
-                '[role="listitem"]',  # Common in modern React apps
-                '[data-job-id]',
-                '[data-automation*="job"]',
-                'article',
-                'ul[role="list"] > li',
-                '[class*="jobCard"]',
-                '[class*="job-card"]',
-                '[class*="JobCard"]',
-                '.job-listing',
-                '.job-item',
-                '[class*="searchResult"]',
-                '[class*="result-item"]',
-                'div[class*="job"]',  # Any div with 'job' in class
-                'div[class*="card"]',  # Card-based layouts
-                'a[href*="/job/"]',  # Links with /job/ in URL
-            ]
-            
-            job_elements = None
             used_selector = None
             
-            for selector in listing_selectors:
+            # Probe every candidate at once, then verify the hits in priority order
+            for selector in await matching_selectors(page, LISTING_SELECTORS):
                 try:
-                    elements = await page.locator(selector).all()
-                    if len(elements) > 0:
-                        logger.info(f"Found {len(elements)} elements with selector: {selector}")
+                    # Text lengths of every match, read in-page in one call
+                    lengths = await page.locator(selector).evaluate_all(
+                        "els => els.map(e => (e.textContent || '').trim().length)"
+                    )
+                    if len(lengths) > 0:
+                        logger.info(f"Found {len(lengths)} elements with selector: {selector}")
                         
                         # Verify these are actually job elements by checking content
                         # A job element should have substantial text content
-                        valid_elements = []
-                        for elem in elements[:10]:  # Check first 10
-                            try:
-                                text = await elem.text_content()
-                                if text and len(text.strip()) > 30:  # At least 30 chars
-                                    valid_elements.append(elem)
-                            except:
-                                continue
+                        valid_count = sum(1 for length in lengths[:10] if length > 30)  # Check first 10
                         
-                        if valid_elements:
-                            logger.info(f"Verified {len(valid_elements)} valid job elements")
-                            job_elements = elements  # Use all elements if some are valid
-                            used_selector = selector
+                        if valid_count:
+                            logger.info(f"Verified {valid_count} valid job elements")
+                            used_selector = selector  # Use all elements if some are valid
                             break
                         else:
                             logger.debug(f"Elements found with {selector} don't look like jobs")
-                            
+                
                 except Exception as e:
                     logger.debug(f"Selector {selector} failed: {e}")
                     continue
             
-            if not job_elements:
+            by_job_link = False
+            if not used_selector:
                 # Last resort: try to find job elements by looking for patterns
                 logger.warning("Standard selectors failed, trying pattern-based search...")
                 
                 try:
-                    # Look for elements that have links with job URLs
-                    job_elements = await page.locator('a[href*="/job/"]').all()
-                    if job_elements:
-                        # Get parent elements as those are likely the job containers
-                        parent_elements = []
-                        for link in job_elements[:50]:  # Limit to first 50
-                            try:
-                                parent = await link.evaluate_handle("el => el.closest('li, div, article')")
-                                if parent:
-                                    parent_elements.append(parent)
-                            except:
-                                continue
-                        
-                        if parent_elements:
-                            job_elements = parent_elements
-                            used_selector = "parent of a[href*='/job/']"
-                            logger.info(f"Found {len(job_elements)} job elements via parent search")
+                    # Look for elements that have links with job URLs; their
+                    # parents are likely the job containers
+                    link_count = await page.locator(self.JOB_LINK_SEL).count()
+                    if link_count:
+                        by_job_link = True
+                        used_selector = f"parent of {self.JOB_LINK_SEL}"
+                        logger.info(f"Found {min(link_count, 50)} job elements via parent search")
                 except Exception as e:
                     logger.error(f"Pattern-based search failed: {e}")
             
-            if not job_elements:
-                # Last resort: log page content for debugging
-                page_text = await page.evaluate("() => document.body.innerText")
-                logger.error("No job listings found with any selector!")
-                logger.info(f"Page text preview: {page_text[:500]}")
-                logger.info(f"Current URL: {page.url}")
-                
-                # Try to get page structure
-                structure = await page.evaluate("""
+            if not used_selector:
+                # Last resort: log page content and structure for debugging
+                page_text, structure = await page.evaluate("""
                     () => {
                         const allElements = {};
                         ['article', 'li', 'div', 'a'].forEach(tag => {
                             allElements[tag] = document.querySelectorAll(tag).length;
                         });
-                        return allElements;
+                        return [document.body.innerText.substring(0, 500), allElements];
                     }
                 """)
+                logger.error("No job listings found with any selector!")
+                logger.info(f"Page text preview: {page_text}")
+                logger.info(f"Current URL: {page.url}")
                 logger.info(f"Page structure: {structure}")
                 return jobs
             
-            # Limit to max_jobs
-            job_elements = job_elements[:max_jobs]
-            logger.info(f"Processing {len(job_elements)} job elements (using selector: {used_selector})")
+            # Extract every job card in a single round-trip
+            rows = json.loads(await page.evaluate(EXTRACT_JOBS_SCRIPT, {
+                'selector': used_selector,
+                'byJobLink': by_job_link,
+                'maxJobs': max_jobs,
+                'fields': JOB_FIELD_SELECTORS,
+                'jobLinkSelector': self.JOB_LINK_SEL,
+                'jobIdPattern': self.JOB_ID_RE.pattern,
+            }))
+            logger.info(f"Processing {len(rows)} job elements (using selector: {used_selector})")
             
-            # Extract job information
-            for idx, element in enumerate(job_elements, 1):
-                try:
-                    await HumanBehavior.random_delay(0.5, 1.5)
-                    
-                    # Extract job details
-                    job_data = {
-                        'scraped_at': datetime.now().isoformat(),
-                        'source': 'Microsoft Careers',
-                        'search_term': 'AI',
-                        'location': 'Seattle',
-                    }
-                    
-                    # Try to extract title with multiple selectors
-                    try:
-                        title_selectors = [
-                            'h2.MZGzlrn8gfgSs8TZHhv2',  # ⭐ ACTUAL class from inspection
-                            'h2',  # Fallback to any h2
-                            'h3', 'h4',
-                            '[class*="title"]', '[class*="Title"]',
-                            '[data-automation*="title"]',
-                            'a[class*="title"]',
-                            '.ms-Link'
-                        ]
-                        title_found = False
-                        for title_sel in title_selectors:
-                            try:
-                                title_elem = element.locator(title_sel).first
-                                title_text = await title_elem.text_content()
-                                if title_text and title_text.strip():
-                                    job_data['title'] = title_text.strip()
-                                    title_found = True
-                                    break
-                            except:
-                                continue
-                        if not title_found:
-                            job_data['title'] = 'N/A'
-                    except Exception:
-                        job_data['title'] = 'N/A'
-                    
-                    # Try to extract location with multiple selectors
-                    try:
-                        location_selectors = [
-                            'i[data-icon-name="POI"] + span',  # ⭐ ACTUAL: span after location icon
-                            'i.wwxC8vs2c2O5YaFddx7C + span',  # Alternative with class
-                            'span:has(+ i[data-icon-name="POI"])',  # Span near location icon
-                            '[class*="location"]', '[class*="Location"]',
-                            '[aria-label*="location"]',
-                            '[data-automation*="location"]',
-                            'span[class*="city"]',
-                            'div[class*="city"]'
-                        ]
-                        location_found = False
-                        for loc_sel in location_selectors:
-                            try:
-                                location_elem = element.locator(loc_sel).first
-                                location_text = await location_elem.text_content()
-                                if location_text and location_text.strip():
-                                    job_data['job_location'] = location_text.strip()
-                                    location_found = True
-                                    break
-                            except:
-                                continue
-                        if not location_found:
-                            job_data['job_location'] = 'N/A'
-                    except Exception:
-                        job_data['job_location'] = 'N/A'
-                    
-                    # Try to extract job ID or URL
-                    try:
-                        # First try to get job ID from aria-label (e.g., "Job item 1827725")
-                        # The aria-label might be on the container or a child div
-                        aria_label = await element.get_attribute('aria-label')
-                        
-                        # If not on container, try child divs
-                        if not aria_label or 'Job item' not in aria_label:
-                            child_divs = element.locator('div[aria-label*="Job item"]')
-                            if await child_divs.count() > 0:
-                                aria_label = await child_divs.first.get_attribute('aria-label')
-                        
-                        if aria_label and 'Job item' in aria_label:
-                            job_id = aria_label.replace('Job item ', '').strip()
-                            job_data['url'] = f"https://careers.microsoft.com/us/en/job/{job_id}"
-                            job_data['job_id'] = job_id
-                        else:
-                            # Try to get href from any link in the element
-                            link_elem = element.locator('a').first
-                            href = await link_elem.get_attribute('href')
-                            if href:
-                                # Make it absolute if relative
-                                if href.startswith('/'):
-                                    job_data['url'] = f"https://careers.microsoft.com{href}"
-                                else:
-                                    job_data['url'] = href
-                            else:
-                                job_data['url'] = 'N/A'
-                    except Exception as e:
-                        # Try to get data-job-id or similar
-                        try:
-                            job_id = await element.get_attribute('data-job-id')
-                            if job_id:
-                                job_data['url'] = f"https://careers.microsoft.com/job/{job_id}"
-                            else:
-                                job_data['url'] = 'N/A'
-                        except:
-                            job_data['url'] = 'N/A'
-                    
-                    # Try to extract posting date
-                    try:
-                        date_selectors = [
-                            'i[data-icon-name="Clock"] + span',  # ⭐ ACTUAL: span after clock icon
-                            '[class*="date"]', '[class*="Date"]',
-                            '[class*="posted"]', '[class*="Posted"]',
-                            '[data-automation*="date"]',
-                            'time'
-                        ]
-                        date_found = False
-                        for date_sel in date_selectors:
-                            try:
-                                date_elem = element.locator(date_sel).first
-                                date_text = await date_elem.text_content()
-                                if date_text and date_text.strip():
-                                    job_data['posted_date'] = date_text.strip()
-                                    date_found = True
-                                    break
-                            except:
-                                continue
-                        if not date_found:
-                            job_data['posted_date'] = 'N/A'
-                    except Exception:
-                        job_data['posted_date'] = 'N/A'
-                    
-                    # Try to extract description snippet
-                    try:
-                        desc_selectors = [
-                            'span[aria-label="job description"]',  # ⭐ ACTUAL from inspection
-                            'span.css-544',  # Alternative with class
-                            'p', '[class*="description"]', '[class*="Description"]',
-                            '[class*="snippet"]', '[data-automation*="description"]'
-                        ]
-                        desc_found = False
-                        for desc_sel in desc_selectors:
-                            try:
-                                desc_elem = element.locator(desc_sel).first
-                                desc_text = await desc_elem.text_content()
-                                if desc_text and len(desc_text.strip()) > 20:  # Meaningful description
-                                    job_data['description'] = desc_text.strip()
-                                    desc_found = True
-                                    break
-                            except:
-                                continue
-                        if not desc_found:
-                            # Fallback: get all text from element
-                            all_text = await element.text_content()
-                            if all_text:
-                                job_data['description'] = all_text.strip()[:500]  # First 500 chars
-                            else:
-                                job_data['description'] = 'N/A'
-                    except Exception:
-                        job_data['description'] = 'N/A'
-                    
-                    jobs.append(job_data)
-                    logger.info(f"Scraped job {idx}/{len(job_elements)}: {job_data['title']}")
-                    
-                except Exception as e:
-                    logger.warning(f"Error scraping job {idx}: {e}")
-                    continue
+            scraped_at = datetime.now(timezone.utc).isoformat()
+            seen: set[str] = set()
+            for idx, row in enumerate(rows, 1):
+                # Skip cards repeated in the listing (rows without a URL can't be compared)
+                url = row.get('url', 'N/A')
+                if url != 'N/A':
+                    if url in seen:
+                        logger.debug(f"Skipping duplicate job {url}")
+                        continue
+                    seen.add(url)
+                
+                job_data = {
+                    'scraped_at': scraped_at,
+                    'source': 'Microsoft Careers',
+                    'search_term': search_term,
+                    'location': location,
+                }
+                job_data.update(row)
+                jobs.append(job_data)
+                logger.info(f"Scraped job {idx}/{len(rows)}: {job_data['title']}")
+                if len(jobs) >= max_jobs:
+                    break
             
             logger.info(f"Successfully scraped {len(jobs)} jobs")
             return jobs
-            
+        
         except Exception as e:
             logger.error(f"Error scraping job listings: {e}")
             return jobs
     
-    async def scrape(self, job_title: str = "AI", location: str = "Seattle", max_jobs: int = 50) -> List[Dict]:
+    async def _scrape_page(
+        self,
+        page: Page,
+        job_title: str,
+        location: str,
+        max_jobs: int
+    ) -> List[Dict]:
+        """Run one search on the given page and return its job listings."""
+        # Navigate to homepage
+        if not await self.navigate_to_homepage(page):
+            return []
+        
+        # Handle cookie consent
+        await self.handle_cookie_consent(page)
+        
+        # Perform search
+        if not await self.search_jobs(page, job_title, location):
+            return []
+        
+        # Scrape job listings
+        return await self.scrape_job_listings(page, max_jobs, job_title, location)
+    
+    async def _cache_get(self, job_title: str, location: str, max_jobs: int) -> Optional[List[Dict]]:
+        """Look up a cached result in a worker thread (None when caching is off)."""
+        if self.cache is None:
+            return None
+        return await asyncio.to_thread(self.cache.get, job_title, location, max_jobs)
+    
+    async def _cache_put(self, job_title: str, location: str, max_jobs: int, jobs: List[Dict]):
+        """Store a result in a worker thread (no-op when caching is off)."""
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put, job_title, location, max_jobs, jobs)
+    
+    async def scrape(
+        self,
+        job_title: str = "AI",
+        location: str = "Seattle",
+        max_jobs: int = 50,
+        browser: Optional[Browser] = None
+    ) -> List[Dict]:
         """
-        Main scraping method.
+        Main scraping method: run one search.
+        
+        A fresh cached result is returned as-is; otherwise the search API is
+        tried first when use_api is set, then the browser: a new context on
+        `browser` if given, a pooled page inside `async with`, or else a
+        browser launched just for this call. With fetch_details set, full
+        descriptions are then filled in from the job-detail API. Use
+        scrape_many() to run several searches at once.
         
         Args:
             job_title: Job title to search for
             location: Location to search in
             max_jobs: Maximum number of jobs to scrape
+            browser: Running browser owned by the caller (e.g. from a pool)
+                to scrape in, with its own context for this search
             
         Returns:
-            List of job dictionaries
+            List of job dictionaries (empty if the search failed)
         """
-        try:
-            await self.initialize_browser()
-            page = await self.context.new_page()
+        jobs = await self._cache_get(job_title, location, max_jobs)
+        if jobs is not None:
+            logger.info(f"Using {len(jobs)} cached jobs for '{job_title}' in '{location}'")
+        else:
+            if self.use_api:
+                try:
+                    jobs = await self.scrape_api(job_title, location, max_jobs)
+                except Exception as e:
+                    logger.warning(f"Search API failed ({e}), falling back to the browser")
             
-            # Set up dialog handlers
-            await self.setup_dialog_handlers(page)
+            if jobs is None:
+                try:
+                    jobs = await self._scrape_in_browser(job_title, location, max_jobs, browser)
+                except Exception as e:
+                    logger.error(f"Error during scraping: {e}")
+                    jobs = []
             
-            # Navigate to homepage
-            if not await self.navigate_to_homepage(page):
-                return []
+            if jobs and self.fetch_details:
+                try:
+                    await self.fetch_job_details(jobs)
+                except RuntimeError as e:
+                    logger.warning(f"Skipping job details: {e}")
             
-            # Handle cookie consent
-            await self.handle_cookie_consent(page)
+            if jobs:
+                await self._cache_put(job_title, location, max_jobs, jobs)
+        
+        self.jobs = jobs
+        return jobs
+    
+    async def _scrape_in_browser(
+        self,
+        job_title: str,
+        location: str,
+        max_jobs: int,
+        browser: Optional[Browser] = None
+    ) -> List[Dict]:
+        """Run one search in the browser once a page slot is free (see max_pages)."""
+        async with self.page_sem:
+            if browser is not None:
+                context = await self.new_context(browser)
+                try:
+                    page = await context.new_page()
+                    await self.setup_dialog_handlers(page)
+                    return await self._scrape_page(page, job_title, location, max_jobs)
+                finally:
+                    await context.close()
+            
+            # Outside `async with`, launch and close a browser just for this call
+            owns_browser = self.browser is None
+            if owns_browser:
+                await self.initialize_browser()
             
-            # Perform search
-            if not await self.search_jobs(page, job_title, location):
-                return []
+            try:
+                page = await self._page_pool.get()
+                try:
+                    return await self._scrape_page(page, job_title, location, max_jobs)
+                finally:
+                    # Drop the page's document before handing it back to the pool
+                    if not owns_browser:
+                        try:
+                            await page.goto("about:blank")
+                        except Exception as e:
+                            logger.debug(f"Error resetting pooled page: {e}")
+                        self._page_pool.put_nowait(page)
+            finally:
+                if owns_browser:
+                    await self.close_browser()
+    
+    def _api_job(self, job: Dict, scraped_at: str, search_term: str, location: str) -> Dict:
+        """Map one search API record onto the scraper's job schema."""
+        properties = job.get('properties') or {}
+        locations = properties.get('locations') or []
+        job_id = str(job['jobId'])
+        return {
+            'scraped_at': scraped_at,
+            'source': 'Microsoft Careers',
+            'search_term': search_term,
+            'location': location,
+            'title': job.get('title') or 'N/A',
+            'job_location': properties.get('primaryLocation') or ', '.join(locations) or 'N/A',
+            'url': self.JOB_URL.format(job_id=job_id),
+            'job_id': job_id,
+            'posted_date': job.get('postingDate') or 'N/A',
+            'description': (properties.get('description') or 'N/A')[:500],
+        }
+    
+    def _new_http_client(self) -> "httpx.AsyncClient":
+        """Create an API client with a bounded connection pool, using HTTP/2 when h2 is installed."""
+        return httpx.AsyncClient(
+            http2=importlib.util.find_spec('h2') is not None,
+            headers={'User-Agent': self.USER_AGENT, 'Accept': 'application/json'},
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+            timeout=30.0,
+        )
+    
+    def _http_client(self):
+        """
+        Get an API client to use with `async with`.
+        
+        Returns:
+            The session client (created on first use inside `async with`), or a
+            temporary client closed when the block exits
+        """
+        if self._http is None and self._in_session:
+            self._http = self._new_http_client()
+        return nullcontext(self._http) if self._http is not None else self._new_http_client()
+    
+    async def _api_get(self, client: "httpx.AsyncClient", url: str, params: Optional[Dict] = None) -> bytes:
+        """
+        GET an API URL within its host's rate limit, retrying network errors.
+        
+        Args:
+            client: HTTP client to send the request with
+            url: URL to fetch
+            params: Optional query parameters
             
-            # Scrape job listings
-            self.jobs = await self.scrape_job_listings(page, max_jobs)
+        Returns:
+            Raw response body
+        
+        Raises:
+            httpx.HTTPStatusError: On a non-2xx response (not retried)
+            httpx.TransportError: If every attempt fails at the network level
+        """
+        async def attempt() -> bytes:
+            async with self.host_limiter.slot(url):
+                async with client.stream('GET', url, params=params) as response:
+                    self.host_limiter.observe(url, response.headers)
+                    response.raise_for_status()
+                    return await response.aread()
+        
+        return await retry_async(
+            attempt, max_attempts=4, backoff_min=0.25, backoff_max=4.0, multiplier=2,
+            retry_on=(httpx.TransportError,)
+        )
+    
+    async def fetch_job_details(self, jobs: List[Dict], max_parallel: int = 16) -> List[Dict]:
+        """
+        Replace each job's description with the full text from the job-detail API.
+        
+        Plain HTTP requests, so this is far cheaper than opening every job
+        page in the browser. Jobs whose details can't be fetched are left as-is.
+        
+        Args:
+            jobs: Job dictionaries with a 'job_id' (updated in place)
+            max_parallel: Maximum number of requests in flight at once
             
-            return self.jobs
+        Returns:
+            The same list of job dictionaries
+        
+        Raises:
+            RuntimeError: If httpx is not installed
+        """
+        if httpx is None:
+            raise RuntimeError("httpx is not installed")
+        
+        sem = asyncio.Semaphore(max_parallel)
+        
+        async def fetch(client: "httpx.AsyncClient", job: Dict):
+            job_id = job.get('job_id')
+            if not job_id or job_id == 'N/A':
+                return
+            try:
+                async with sem:
+                    body = await self._api_get(client, self.API_JOB_URL.format(job_id=job_id))
+                data = orjson.loads(body) if orjson is not None else json.loads(body)
+                description = data['operationResult']['result'].get('description')
+            except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(f"Could not fetch details for job {job_id}: {e!r}")
+                return
+            if description:
+                # The API returns HTML; keep the text like the scraped fields
+                job['description'] = ' '.join(html.unescape(re.sub(r'<[^>]+>', ' ', description)).split())
+        
+        async with self._http_client() as client:
+            await asyncio.gather(*(fetch(client, job) for job in jobs))
+        return jobs
+    
+    async def _api_page(self, client: "httpx.AsyncClient", job_title: str, location: str, page_number: int) -> List[Dict]:
+        """
+        Fetch one page of raw search API results, reusing recent identical requests.
+        
+        Args:
+            client: HTTP client to send the request with
+            job_title: Job title to search for
+            location: Location to search in
+            page_number: One-based results page
             
-        except Exception as e:
-            logger.error(f"Error during scraping: {e}")
-            return []
-        finally:
-            await self.close_browser()
+        Returns:
+            List of raw API job records
+        
+        Raises:
+            ValueError: If the response doesn't have the expected shape
+            httpx.HTTPError: On network errors or non-2xx responses
+        """
+        key = (job_title, location, page_number)
+        hit = self._api_pages.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.API_CACHE_TTL:
+            self._api_pages.move_to_end(key)
+            return hit[1]
+        
+        body = await self._api_get(client, self.API_URL, params={
+            'q': job_title,
+            'lc': location,
+            'l': 'en_us',
+            'pg': page_number,
+            'pgSz': self.API_PAGE_SIZE,
+            'o': 'Relevance',
+            'flt': 'true',
+        })
+        data = orjson.loads(body) if orjson is not None else json.loads(body)
+        try:
+            results = data['operationResult']['result']['jobs']
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Unexpected search API response: {e!r}") from e
+        
+        self._api_pages[key] = (time.monotonic(), results)
+        self._api_pages.move_to_end(key)
+        while len(self._api_pages) > self.API_CACHE_SIZE:
+            self._api_pages.popitem(last=False)
+        return results
     
-    def save_to_csv(self, filename: Optional[str] = None):
-        """Save scraped jobs to CSV file."""
-        if not self.jobs:
-            logger.warning("No jobs to save")
-            return
+    async def scrape_api(self, job_title: str, location: str, max_jobs: int = 50) -> List[Dict]:
+        """
+        Fetch jobs from the careers site's JSON search API, without a browser.
         
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"microsoft_ai_jobs_{timestamp}.csv"
+        Args:
+            job_title: Job title to search for
+            location: Location to search in
+            max_jobs: Maximum number of jobs to return
+            
+        Returns:
+            List of job dictionaries in the same shape as scrape_job_listings
         
-        # Create output directory if it doesn't exist
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
+        Raises:
+            RuntimeError: If httpx is not installed
+            ValueError: If the response doesn't have the expected shape
+            httpx.HTTPError: On network errors or non-2xx responses
+        """
+        if httpx is None:
+            raise RuntimeError("httpx is not installed")
         
-        filepath = output_dir / filename
+        logger.info(f"Querying search API for '{job_title}' jobs in '{location}'")
+        scraped_at = datetime.now(timezone.utc).isoformat()
+        jobs: List[Dict] = []
+        seen: set[str] = set()
         
-        df = pd.DataFrame(self.jobs)
-        df.to_csv(filepath, index=False)
+        # Reuse the session client's pooled connections inside `async with`
+        async with self._http_client() as client:
+            page_number = 1
+            while len(jobs) < max_jobs:
+                results = await self._api_page(client, job_title, location, page_number)
+                try:
+                    page_jobs = [self._api_job(job, scraped_at, job_title, location) for job in results]
+                except (KeyError, TypeError) as e:
+                    raise ValueError(f"Unexpected search API response: {e!r}") from e
+                
+                for job in page_jobs:
+                    if job['job_id'] not in seen and len(jobs) < max_jobs:
+                        seen.add(job['job_id'])
+                        jobs.append(job)
+                
+                if len(page_jobs) < self.API_PAGE_SIZE:
+                    break
+                page_number += 1
         
-        logger.info(f"Saved {len(self.jobs)} jobs to {filepath}")
+        logger.info(f"Search API returned {len(jobs)} jobs")
+        return jobs
     
-    def save_to_json(self, filename: Optional[str] = None):
-        """Save scraped jobs to JSON file."""
-        import json
+    async def scrape_many(
+        self,
+        queries: List[Tuple[str, str, int]],
+        max_parallel: int = 3,
+        browser: Optional[Browser] = None
+    ) -> List[List[Dict]]:
+        """
+        Run several searches concurrently through scrape().
+        
+        Every search shares this scraper's cache, pacing and rate limits and
+        gets its own browser context: on `browser` if given, else on the
+        scraper's own browser, which is started for the batch when not
+        already inside `async with`.
+        
+        Args:
+            queries: (job_title, location, max_jobs) tuples
+            max_parallel: Maximum number of searches running at once
+            browser: Running browser owned by the caller (e.g. from a pool)
+            
+        Returns:
+            One list of job dictionaries per query, in query order
+            (empty for queries that failed)
+        """
+        owns_browser = browser is None and self.browser is None
+        sem = asyncio.Semaphore(max_parallel)
+        
+        async def run(job_title: str, location: str, max_jobs: int) -> List[Dict]:
+            async with sem:
+                return await self.scrape(job_title, location, max_jobs, browser=browser or self.browser)
         
-        if not self.jobs:
+        try:
+            if owns_browser:
+                await self.initialize_browser()
+            results = await asyncio.gather(*(run(*query) for query in queries))
+        finally:
+            if owns_browser:
+                await self.close_browser()
+        
+        self.jobs = [job for jobs in results for job in jobs]
+        return results
+    
+    def _output_paths(self, csv_filename: Optional[str] = None, json_filename: Optional[str] = None) -> Tuple[Path, Path]:
+        """Resolve the CSV and JSON files in the output directory, defaulting to one shared timestamp."""
+        csv_path, json_path = make_output_paths(cfg=self._output_cfg)
+        return (
+            self.output_dir / csv_filename if csv_filename else csv_path,
+            self.output_dir / json_filename if json_filename else json_path,
+        )
+    
+    def save_to_csv(self, filename: Optional[str] = None, jobs: Optional[List[Dict]] = None) -> Optional[Path]:
+        """Save scraped jobs (default: self.jobs) to CSV file."""
+        jobs = self.jobs if jobs is None else jobs
+        if not jobs:
             logger.warning("No jobs to save")
-            return
+            return None
         
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"microsoft_ai_jobs_{timestamp}.json"
+        csv_path, _ = self._output_paths(csv_filename=filename)
+        return write_jobs(jobs, path=csv_path, fieldnames=SCHEMA)
+    
+    def save_to_json(self, filename: Optional[str] = None, jobs: Optional[List[Dict]] = None) -> Optional[Path]:
+        """Save scraped jobs (default: self.jobs) to JSON file."""
+        jobs = self.jobs if jobs is None else jobs
+        if not jobs:
+            logger.warning("No jobs to save")
+            return None
         
-        # Create output directory if it doesn't exist
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
+        _, json_path = self._output_paths(json_filename=filename)
+        return write_json(jobs, path=json_path)
+    
+    def save(self, csv_filename: Optional[str] = None, json_filename: Optional[str] = None) -> asyncio.Future:
+        """
+        Start saving the current jobs to CSV and JSON in worker threads.
         
-        filepath = output_dir / filename
+        The jobs list is captured when this is called, so the next scrape can
+        start right away while this batch is still being written. Must be
+        called from a running event loop.
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.jobs, f, indent=2, ensure_ascii=False)
+        Args:
+            csv_filename: CSV file name inside output/ (default: timestamped)
+            json_filename: JSON file name inside output/ (default: timestamped)
         
-        logger.info(f"Saved {len(self.jobs)} jobs to {filepath}")
+        Returns:
+            Future to await for completion of both writes (see output.save_jobs)
+        """
+        csv_path, json_path = self._output_paths(csv_filename, json_filename)
+        return save_jobs(self.jobs, csv_path=csv_path, json_path=json_path)
 
 
 async def main():
@@ -761,16 +1350,20 @@ async def main():
                 print(f"  URL: {job.get('url', 'N/A')[:80]}...")
                 print()
             
-            # Save results
-            scraper.save_to_csv()
-            scraper.save_to_json()
+            # Save results (CSV and JSON written in worker threads)
+            await save_jobs(jobs)
         else:
             print("No jobs were scraped")
-            
+    
     except Exception as e:
         logger.error(f"Error in main: {e}")
         raise
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional (unavailable on Windows): stdlib event loop
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -0,0 +1,141 @@
+"""
+Output writers for scraped jobs
+Uses pyarrow's vectorized CSV writer when installed, otherwise stdlib csv,
+and orjson for JSON when installed.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional: fall back to stdlib csv
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json
+    orjson = None
+
+from config import OUTPUT_CONFIG, make_output_paths
+
+
+logger = logging.getLogger(__name__)
+
+# Column order for saved jobs
+SCHEMA = (
+    "scraped_at", "source", "search_term", "location",
+    "title", "job_location", "url", "job_id", "posted_date", "description",
+)
+
+
+def _fieldnames(rows: List[Dict]) -> List[str]:
+    """Return the union of row keys in first-seen order."""
+    return list(dict.fromkeys(key for row in rows for key in row))
+
+
+def write_jobs(
+    rows: List[Dict],
+    cfg: Mapping = OUTPUT_CONFIG,
+    path: Optional[Path] = None,
+    fieldnames: Optional[Sequence[str]] = None,
+) -> Optional[Path]:
+    """
+    Write job dictionaries to a CSV file.
+    
+    Args:
+        rows: Job dictionaries; missing keys are written as empty cells
+        cfg: Output settings (directory, csv_prefix, timestamp_format)
+        path: Explicit output path (defaults to the CSV path from make_output_paths)
+        fieldnames: CSV columns (defaults to the union of row keys); keys
+            not listed are dropped
+    
+    Returns:
+        Path of the written file, or None if there was nothing to write
+    """
+    if not rows:
+        logger.warning("No jobs to save")
+        return None
+    
+    if path is None:
+        path, _ = make_output_paths(cfg=cfg)
+    
+    fieldnames = list(fieldnames or _fieldnames(rows))
+    if pa is not None:
+        table = pa.Table.from_pydict({name: [row.get(name) for row in rows] for name in fieldnames})
+        pa_csv.write_csv(table, path)
+    else:
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+    
+    logger.info(f"Saved {len(rows)} jobs to {path}")
+    return path
+
+
+def write_json(rows: List[Dict], cfg: Mapping = OUTPUT_CONFIG, path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Write job dictionaries to an indented JSON file.
+    
+    Args:
+        rows: Job dictionaries
+        cfg: Output settings (directory, json_prefix, timestamp_format)
+        path: Explicit output path (defaults to the JSON path from make_output_paths)
+    
+    Returns:
+        Path of the written file, or None if there was nothing to write
+    """
+    if not rows:
+        logger.warning("No jobs to save")
+        return None
+    
+    if path is None:
+        _, path = make_output_paths(cfg=cfg)
+    
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(rows, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+    
+    logger.info(f"Saved {len(rows)} jobs to {path}")
+    return path
+
+
+def save_jobs(
+    jobs: List[Dict],
+    cfg: Mapping = OUTPUT_CONFIG,
+    csv_path: Optional[Path] = None,
+    json_path: Optional[Path] = None,
+) -> asyncio.Future:
+    """
+    Start writing jobs to CSV (in SCHEMA column order) and JSON in worker threads.
+    
+    The jobs list is captured when this is called, so the caller can move on
+    while it is written. Must be called from a running event loop.
+    
+    Args:
+        jobs: Job dictionaries
+        cfg: Output settings for the default paths
+        csv_path: CSV output path (default: from make_output_paths)
+        json_path: JSON output path (default: from make_output_paths)
+    
+    Returns:
+        Future resolving to the (csv_path, json_path) written, each None if
+        there was nothing to write
+    """
+    if csv_path is None or json_path is None:
+        # One timestamp for both default filenames
+        default_csv, default_json = make_output_paths(cfg=cfg)
+        csv_path = csv_path or default_csv
+        json_path = json_path or default_json
+    return asyncio.gather(
+        asyncio.to_thread(write_jobs, jobs, path=csv_path, fieldnames=SCHEMA),
+        asyncio.to_thread(write_json, jobs, path=json_path),
+    )
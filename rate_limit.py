@@ -0,0 +1,174 @@
+"""
+Client-side rate limiting for requests to the careers site
+A token bucket admits calls at a steady rate with room for short bursts,
+so the scrapers pace themselves instead of waiting for 429s. An AIMD
+controller adapts how many navigations run at once to the site's health,
+and a per-host limiter caps concurrent API requests by the server's
+advertised rate-limit budget.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Mapping
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at `rps` tokens per second."""
+    
+    def __init__(self, rps: float, burst: int):
+        """
+        Initialize the bucket, starting full.
+        
+        Args:
+            rps: Sustained rate in acquisitions per second
+            burst: Maximum number of tokens (calls allowed back-to-back)
+        """
+        self.rps = rps
+        self.burst = burst
+        self.tokens = float(burst)
+        self.ts = time.monotonic()
+    
+    async def acquire(self):
+        """Take one token, sleeping until it is available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.ts) * self.rps)
+        self.ts = now
+        
+        # Reserve the token up front so concurrent callers queue behind each
+        # other instead of all waking up for the same refill
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rps)
+
+
+class AIMDController:
+    """
+    Additive-increase/multiplicative-decrease limit on concurrent navigations.
+    
+    Each admitted call that finishes within `target_latency` raises the limit
+    by `alpha`; an error or a slow call multiplies it by `beta`. Server
+    cooldowns (Retry-After on 429/503) also pause new admissions.
+    """
+    
+    def __init__(
+        self,
+        concurrency: float = 2.0,
+        target_latency: float = 10.0,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        min_concurrency: float = 1.0,
+        max_concurrency: float = 8.0,
+    ):
+        """
+        Initialize the controller.
+        
+        Args:
+            concurrency: Starting number of calls allowed in flight
+            target_latency: Seconds a call may take and still count as healthy
+            alpha: Amount added to the limit after a healthy call
+            beta: Factor applied to the limit after an error or slow call
+            min_concurrency: Lower bound for the limit
+            max_concurrency: Upper bound for the limit
+        """
+        self.concurrency = concurrency
+        self.target_latency = target_latency
+        self.alpha = alpha
+        self.beta = beta
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self._retry_at = 0.0
+        self._cond = asyncio.Condition()
+    
+    def _decrease(self):
+        self.concurrency = max(self.min_concurrency, self.concurrency * self.beta)
+    
+    def _increase(self):
+        self.concurrency = min(self.max_concurrency, self.concurrency + self.alpha)
+    
+    def retry_after(self, seconds: float):
+        """Back off after a 429/503: shrink the limit and pause admissions."""
+        self._retry_at = max(self._retry_at, time.monotonic() + seconds)
+        self._decrease()
+    
+    def cooldown(self) -> float:
+        """Return the seconds left in the current server cooldown (0 if none)."""
+        return max(0.0, self._retry_at - time.monotonic())
+    
+    @asynccontextmanager
+    async def admit(self):
+        """Wait for a free slot (and any cooldown), then time the wrapped call."""
+        while True:
+            async with self._cond:
+                delay = self.cooldown()
+                if delay <= 0:
+                    if self.in_flight < int(self.concurrency):
+                        self.in_flight += 1
+                        break
+                    await self._cond.wait()
+                    continue
+            # Sleep out the cooldown without the lock, so finishing calls can
+            # still release their slots
+            await asyncio.sleep(delay)
+        
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException:
+            self._decrease()
+            raise
+        else:
+            if time.monotonic() - start <= self.target_latency:
+                self._increase()
+            else:
+                self._decrease()
+        finally:
+            async with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+
+class HostRateLimiter:
+    """
+    Per-host cap on concurrent requests, tightened by X-RateLimit-Remaining.
+    
+    Each host starts at `limit` requests in flight. Whenever a response
+    reports how many requests remain in the server's window, the host's cap
+    is lowered to that budget (never below one), and raised back as the
+    budget recovers.
+    """
+    
+    def __init__(self, limit: int = 16):
+        """
+        Initialize the limiter.
+        
+        Args:
+            limit: Maximum concurrent requests per host
+        """
+        self.limit = limit
+        self.caps: Dict[str, int] = {}
+        self.in_flight: Dict[str, int] = {}
+        self._cond = asyncio.Condition()
+    
+    def observe(self, url: str, headers: Mapping[str, str]):
+        """Resize the host's cap from a response's X-RateLimit-Remaining header."""
+        remaining = headers.get('x-ratelimit-remaining')
+        if remaining is None or not remaining.strip().isdigit():
+            return
+        self.caps[urlsplit(str(url)).netloc] = max(1, min(self.limit, int(remaining)))
+    
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Wait until the URL's host is under its cap, then hold a slot for the wrapped request."""
+        host = urlsplit(str(url)).netloc
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight.get(host, 0) < self.caps.get(host, self.limit))
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self.in_flight[host] -= 1
+                self._cond.notify_all()
@@ -0,0 +1,75 @@
+"""
+Retry helper with full-jitter exponential backoff, driven by RETRY_CONFIG.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from playwright.async_api import Error as PlaywrightError
+
+from config import RETRY_CONFIG
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def backoff_delay(attempt: int, backoff_min: float, backoff_max: float, multiplier: float) -> float:
+    """
+    Compute a full-jitter backoff delay for a zero-based attempt number.
+    
+    Args:
+        attempt: Number of attempts already failed, minus one
+        backoff_min: Base delay in seconds
+        backoff_max: Upper bound for the delay in seconds
+        multiplier: Exponential growth factor
+    
+    Returns:
+        Delay in seconds, drawn uniformly from [0, min(backoff_max, backoff_min * multiplier**attempt)]
+    """
+    return random.uniform(0, min(backoff_max, backoff_min * multiplier ** attempt))
+
+
+async def retry_async(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    max_attempts: int = RETRY_CONFIG['max_attempts'],
+    backoff_min: float = RETRY_CONFIG['backoff_min'],
+    backoff_max: float = RETRY_CONFIG['backoff_max'],
+    multiplier: float = RETRY_CONFIG['backoff_multiplier'],
+    tracker: Optional[object] = None,
+    retry_on: Tuple[Type[BaseException], ...] = (PlaywrightError,),
+) -> T:
+    """
+    Await fn(), retrying transient errors with jittered exponential backoff.
+    
+    Args:
+        fn: Zero-argument callable returning a fresh awaitable on each call
+        max_attempts: Total number of attempts before giving up
+        backoff_min: Base delay in seconds
+        backoff_max: Upper bound for a single delay in seconds
+        multiplier: Exponential growth factor
+        tracker: Optional RetryAfterTracker; its pending Retry-After cooldown
+            is used whenever it is longer than the jittered delay
+        retry_on: Exception types worth retrying (default: Playwright errors)
+    
+    Returns:
+        Result of the first successful call
+    
+    Raises:
+        The last retried error once all attempts are exhausted
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await fn()
+        except retry_on as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = backoff_delay(attempt, backoff_min, backoff_max, multiplier)
+            if tracker is not None:
+                delay = max(delay, tracker.peek())
+            logger.warning(f"Attempt {attempt + 1}/{max_attempts} failed ({e}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
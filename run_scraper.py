@@ -4,53 +4,167 @@ Quick runner script for Microsoft Careers Scraper
 """
 
 import asyncio
+import json
+import multiprocessing
+import os
+import queue
 import sys
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+import playwright
+from playwright.async_api import async_playwright
+
+from browser_pool import BrowserPool
 from microsoft_scraper import MicrosoftCareersScraper
 from config import SCRAPER_CONFIG
+from output import save_jobs
+
+# Run each scrape from the menu in its own process (SCRAPER_ISOLATE=1): slower
+# to start, but a crash can't take the menu down and memory goes back to the OS
+ISOLATE_SCRAPES = os.environ.get('SCRAPER_ISOLATE') == '1'
+
+# Config lookups and menu text resolved once at import
+_DEFAULT_JOB_TITLE = SCRAPER_CONFIG['default_job_title']
+_DEFAULT_LOCATION = SCRAPER_CONFIG['default_location']
+_DEFAULT_MAX_JOBS = SCRAPER_CONFIG['max_jobs']
+_DEFAULT_HEADLESS = SCRAPER_CONFIG['headless']
+
+_BANNER = "\n" + "="*70 + "\n" + " "*15 + "MICROSOFT CAREERS SCRAPER\n" + "="*70 + "\n"
+
+_MENU = (
+    "Select an option:\n"
+    "1. Scrape AI jobs in Seattle (default)\n"
+    "2. Custom search\n"
+    "3. Run tests\n"
+    "4. Exit\n"
+)
 
 
 def print_banner():
     """Print application banner."""
-    print("\n" + "="*70)
-    print(" " * 15 + "MICROSOFT CAREERS SCRAPER")
-    print("="*70 + "\n")
+    print(_BANNER)
 
 
 def print_menu():
     """Print interactive menu."""
-    print("Select an option:")
-    print("1. Scrape AI jobs in Seattle (default)")
-    print("2. Custom search")
-    print("3. Run tests")
-    print("4. Exit")
-    print()
+    print(_MENU)
 
 
-async def scrape_with_config(job_title: str, location: str, max_jobs: int, headless: bool = False):
+async def _get_pool(pools: Optional[Dict[bool, BrowserPool]], headless: bool) -> Optional[BrowserPool]:
+    """
+    Return the pool for this headless mode, starting it on first use.
+    
+    Args:
+        pools: Pools by headless mode, filled in lazily (None to not pool)
+        headless: Whether the scrape runs headless
+    
+    Returns:
+        Ready BrowserPool, or None if pooling is off or the pool can't start
+    """
+    if pools is None:
+        return None
+    pool = pools.get(headless)
+    if pool is None:
+        pool = BrowserPool(headless=headless, args=MicrosoftCareersScraper.launch_args(headless))
+        try:
+            await pool.initialize()
+        except Exception as e:
+            print(f"⚠️  Could not start a browser pool ({e}); launching a browser for this run")
+            await pool.drain(timeout=0)
+            return None
+        pools[headless] = pool
+    return pool
+
+
+@asynccontextmanager
+async def _shared_browser(headless: bool = False, pool: Optional[BrowserPool] = None):
+    """Borrow a browser from pool, or launch one for a batch of searches and close it on exit."""
+    if pool is not None and pool.headless == headless:
+        async with pool.browser() as browser:
+            yield browser
+        return
+    
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=headless,
+            args=MicrosoftCareersScraper.launch_args(headless)
+        )
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
+async def scrape_many(
+    queries: List[Tuple[str, str]],
+    max_jobs: int,
+    headless: bool = False,
+    concurrency: int = 3,
+    pool: Optional[BrowserPool] = None
+) -> List[Dict]:
+    """
+    Run several searches concurrently in one shared browser and merge their results.
+    
+    Each search gets its own browser context rather than its own browser,
+    and all of them go through one scraper, so adaptive pacing, API rate
+    limits and the saved cookie state are shared across the batch.
+    
+    Args:
+        queries: (job_title, location) pairs to search for
+        max_jobs: Maximum number of jobs to scrape per search
+        headless: Whether to run in headless mode
+        concurrency: Maximum number of searches running at once
+        pool: Browser pool to borrow from instead of launching a browser
+    
+    Returns:
+        Jobs from all successful searches, in query order
+    """
+    scraper = MicrosoftCareersScraper(headless=headless)
+    
+    async with _shared_browser(headless, pool) as browser:
+        results = await scraper.scrape_many(
+            [(job_title, location, max_jobs) for job_title, location in queries],
+            max_parallel=concurrency,
+            browser=browser
+        )
+    
+    jobs = []
+    for (job_title, location), result in zip(queries, results):
+        if not result:
+            print(f"⚠️  No jobs from the search for '{job_title}' in '{location}'")
+        jobs.extend(result)
+    return jobs
+
+
+async def scrape_with_config(
+    queries: List[Tuple[str, str]],
+    max_jobs: int,
+    headless: bool = False,
+    pool: Optional[BrowserPool] = None
+) -> List[Dict]:
     """
     Run scraper with given configuration.
     
     Args:
-        job_title: Job title to search for
-        location: Location to search in
-        max_jobs: Maximum number of jobs to scrape
+        queries: (job_title, location) pairs to search for
+        max_jobs: Maximum number of jobs to scrape per search
         headless: Whether to run in headless mode
+        pool: Browser pool reused across runs (see interactive_mode)
+    
+    Returns:
+        Jobs from all searches (empty if none were scraped)
     """
-    print(f"\n🔍 Searching for '{job_title}' jobs in '{location}'...")
+    for job_title, location in queries:
+        print(f"\n🔍 Searching for '{job_title}' jobs in '{location}'...")
     print(f"📊 Max jobs to scrape: {max_jobs}")
     print(f"🤖 Headless mode: {headless}")
     print("\n" + "-"*70 + "\n")
     
-    scraper = MicrosoftCareersScraper(headless=headless)
-    
     try:
-        jobs = await scraper.scrape(
-            job_title=job_title,
-            location=location,
-            max_jobs=max_jobs
-        )
+        jobs = await scrape_many(queries, max_jobs=max_jobs, headless=headless, pool=pool)
         
         if jobs:
             print("\n" + "="*70)
@@ -68,71 +182,258 @@ async def scrape_with_config(job_title: str, location: str, max_jobs: int, headl
                 print(f"   🔗 URL: {job.get('url', 'N/A')[:60]}...")
                 print()
             
-            # Save results
+            # Save the merged results once
             print("💾 Saving results...")
-            scraper.save_to_csv()
-            scraper.save_to_json()
+            # Written in worker threads so the event loop isn't blocked
+            await save_jobs(jobs)
             
             print("\n✨ Done! Check the 'output' directory for results.\n")
         else:
             print("\n❌ No jobs were scraped. Please check the logs for errors.\n")
+        return jobs
             
     except KeyboardInterrupt:
         print("\n\n⚠️  Scraping interrupted by user.\n")
+        return []
     except Exception as e:
         print(f"\n❌ Error during scraping: {e}\n")
         raise
 
 
-async def run_default_scrape():
+def _scrape_entry(queries: List[Tuple[str, str]], max_jobs: int, headless: bool, results):
+    """Child process target: run one scrape and send the jobs back to the parent."""
+    results.put(_run(scrape_with_config(queries, max_jobs, headless)))
+
+
+def _run_isolated(queries: List[Tuple[str, str]], max_jobs: int, headless: bool) -> Optional[List[Dict]]:
+    """
+    Run scrape_with_config in a fresh child process and wait for it.
+    
+    Args:
+        queries: (job_title, location) pairs to search for
+        max_jobs: Maximum number of jobs to scrape per search
+        headless: Whether to run in headless mode
+    
+    Returns:
+        The child's jobs, or None if it exited abnormally
+    """
+    ctx = multiprocessing.get_context('spawn')
+    results = ctx.Queue()
+    proc = ctx.Process(target=_scrape_entry, args=(queries, max_jobs, headless, results))
+    proc.start()
+    
+    # Drain the queue while waiting; joining first can deadlock on a large result
+    jobs = None
+    while jobs is None and (proc.is_alive() or not results.empty()):
+        try:
+            jobs = results.get(timeout=0.5)
+        except queue.Empty:
+            pass
+    proc.join()
+    return jobs if proc.exitcode == 0 else None
+
+
+async def _scrape(
+    queries: List[Tuple[str, str]],
+    max_jobs: int,
+    headless: bool,
+    pools: Optional[Dict[bool, BrowserPool]] = None
+):
+    """Run scrape_with_config here, or in a child process when ISOLATE_SCRAPES is set."""
+    if not ISOLATE_SCRAPES:
+        pool = await _get_pool(pools, headless)
+        await scrape_with_config(queries=queries, max_jobs=max_jobs, headless=headless, pool=pool)
+    elif await asyncio.to_thread(_run_isolated, queries, max_jobs, headless) is None:
+        print("\n❌ The scraper process exited unexpectedly. You can try again from the menu.\n")
+
+
+def _split(value: str, default: str) -> List[str]:
+    """Split a comma-separated answer, falling back to default when empty."""
+    return [part.strip() for part in value.split(',') if part.strip()] or [default]
+
+
+async def run_default_scrape(pools: Optional[Dict[bool, BrowserPool]] = None):
     """Run scraper with default configuration."""
-    await scrape_with_config(
-        job_title=SCRAPER_CONFIG['default_job_title'],
-        location=SCRAPER_CONFIG['default_location'],
-        max_jobs=SCRAPER_CONFIG['max_jobs'],
-        headless=SCRAPER_CONFIG['headless']
+    await _scrape(
+        queries=[(_DEFAULT_JOB_TITLE, _DEFAULT_LOCATION)],
+        max_jobs=_DEFAULT_MAX_JOBS,
+        headless=_DEFAULT_HEADLESS,
+        pools=pools
     )
 
 
-async def run_custom_scrape():
+# Bytes read from stdin past the last line handed out by _prompt()
+_stdin_pending = bytearray()
+
+
+def _read_line() -> str:
+    """
+    Read one line from the stdin file descriptor.
+    
+    Reads the descriptor directly instead of through sys.stdin, so a thread
+    blocked here holds no interpreter locks and can't stall shutdown.
+    
+    Raises:
+        EOFError: If stdin is closed before any input arrives
+    """
+    while b'\n' not in _stdin_pending:
+        chunk = os.read(sys.stdin.fileno(), 4096)
+        if not chunk:
+            if not _stdin_pending:
+                raise EOFError("EOF when reading a line")
+            break
+        _stdin_pending.extend(chunk)
+    line, _, rest = bytes(_stdin_pending).partition(b'\n')
+    _stdin_pending[:] = rest
+    return line.decode(sys.stdin.encoding or 'utf-8', errors='replace').rstrip('\r')
+
+
+async def _prompt(text: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    The read runs in a daemon thread rather than asyncio.to_thread: the default
+    executor is joined at shutdown, so Ctrl-C at a prompt would hang until
+    Enter was pressed.
+    """
+    loop = asyncio.get_running_loop()
+    answer = loop.create_future()
+    
+    def settle(result: Optional[str], error: Optional[BaseException]):
+        if answer.done():
+            return
+        if error is not None:
+            answer.set_exception(error)
+        else:
+            answer.set_result(result)
+    
+    def read():
+        try:
+            outcome = (_read_line().strip(), None)
+        except Exception as e:  # e.g. EOFError once stdin is closed
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:  # loop already closed after an interrupt
+            pass
+    
+    print(text, end='', flush=True)
+    threading.Thread(target=read, name='menu-prompt', daemon=True).start()
+    return await answer
+
+
+async def run_custom_scrape(pools: Optional[Dict[bool, BrowserPool]] = None):
     """Run scraper with custom user input."""
     print("\n📝 Custom Search Configuration\n")
     
-    job_title = input("Enter job title (default: AI): ").strip() or "AI"
-    location = input("Enter location (default: Seattle): ").strip() or "Seattle"
+    job_titles = _split(await _prompt("Enter job titles, comma-separated (default: AI): "), "AI")
+    locations = _split(await _prompt("Enter locations, comma-separated (default: Seattle): "), "Seattle")
     
     try:
-        max_jobs = input("Enter max jobs to scrape (default: 50): ").strip()
+        max_jobs = await _prompt("Enter max jobs to scrape (default: 50): ")
         max_jobs = int(max_jobs) if max_jobs else 50
     except ValueError:
         print("Invalid number, using default (50)")
         max_jobs = 50
     
-    headless_input = input("Run in headless mode? (y/N): ").strip().lower()
+    headless_input = (await _prompt("Run in headless mode? (y/N): ")).lower()
     headless = headless_input in ['y', 'yes']
     
-    await scrape_with_config(
-        job_title=job_title,
-        location=location,
+    await _scrape(
+        queries=[(job_title, location) for job_title in job_titles for location in locations],
         max_jobs=max_jobs,
-        headless=headless
+        headless=headless,
+        pools=pools
+    )
+
+
+def _chromium_installed() -> bool:
+    """
+    Check for the Chromium builds this Playwright release expects, without starting Playwright.
+    
+    Reads the pinned revisions from the driver's browsers.json; if that can't
+    be read, reports False so `playwright install` (a no-op when current) runs.
+    """
+    try:
+        manifest = Path(playwright.__file__).parent / 'driver' / 'package' / 'browsers.json'
+        revisions = {
+            entry['name']: entry['revision']
+            for entry in json.loads(manifest.read_text())['browsers']
+            if entry['name'] in ('chromium', 'chromium-headless-shell')
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    if not revisions:
+        return False
+    
+    browsers_path = os.environ.get('PLAYWRIGHT_BROWSERS_PATH')
+    if browsers_path and browsers_path != '0':
+        root = Path(browsers_path)
+    elif sys.platform == 'win32':
+        root = Path(os.environ.get('LOCALAPPDATA', Path.home())) / 'ms-playwright'
+    elif sys.platform == 'darwin':
+        root = Path.home() / 'Library' / 'Caches' / 'ms-playwright'
+    else:
+        root = Path.home() / '.cache' / 'ms-playwright'
+    # Installed as e.g. chromium-1243 and chromium_headless_shell-1243
+    return all((root / f"{name.replace('-', '_')}-{revision}").is_dir() for name, revision in revisions.items())
+
+
+async def _stream_subprocess(*args: str, **kwargs) -> int:
+    """
+    Run a command, echoing its combined stdout/stderr as it arrives.
+    
+    Args:
+        *args: Program and arguments
+        **kwargs: Extra options for asyncio.create_subprocess_exec (cwd, env, ...)
+    
+    Returns:
+        The process exit code
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        **kwargs
     )
+    async for line in proc.stdout:
+        sys.stdout.write(line.decode(errors='replace'))
+        sys.stdout.flush()
+    return await proc.wait()
 
 
-def run_tests():
-    """Run the test suite."""
-    import subprocess
+async def run_tests():
+    """Run the test suite without blocking the event loop."""
+    import importlib.util
     
     print("\n🧪 Running test suite...\n")
     print("-"*70 + "\n")
     
+    # Same interpreter as the menu, so the tests see the same packages
+    args = [sys.executable, '-m', 'pytest', 'test_microsoft_scraper.py', '-v']
+    # Spread tests over all cores when pytest-xdist is installed; each
+    # worker pays for its own Chromium instead of every test in turn
+    if importlib.util.find_spec('xdist') is not None:
+        args += ['-n', 'auto']
+    # Skip writing .pytest_cache unless asked (e.g. for --lf / --ff reruns)
+    if os.environ.get('SCRAPER_TEST_CACHE') != '1':
+        args += ['-p', 'no:cacheprovider']
+    # Output goes through a pipe, so ask for colour explicitly on a terminal
+    if sys.stdout.isatty():
+        args += ['--color=yes']
+    
+    # No screenshots or videos from unit tests, and no per-keystroke typing
+    env = {**os.environ, 'PW_TEST_SCREENSHOT': 'off', 'PW_TEST_VIDEO': 'off', 'SCRAPER_FAST_INPUT': '1'}
+    
     try:
-        result = subprocess.run(
-            ['pytest', 'test_microsoft_scraper.py', '-v'],
-            cwd=Path(__file__).parent
-        )
+        # Only download Chromium on a cold checkout
+        if not _chromium_installed():
+            print("📦 Installing Playwright Chromium...\n")
+            await _stream_subprocess(sys.executable, '-m', 'playwright', 'install', 'chromium', env=env)
+        
+        returncode = await _stream_subprocess(*args, cwd=str(Path(__file__).parent), env=env)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("\n✅ All tests passed!\n")
         else:
             print("\n❌ Some tests failed. Please review the output above.\n")
@@ -147,31 +448,49 @@ async def interactive_mode():
     """Run in interactive mode with menu."""
     print_banner()
     
-    while True:
-        print_menu()
-        choice = input("Enter your choice (1-4): ").strip()
-        
-        if choice == '1':
-            await run_default_scrape()
-            input("\nPress Enter to continue...")
-            print("\n")
-            
-        elif choice == '2':
-            await run_custom_scrape()
-            input("\nPress Enter to continue...")
-            print("\n")
-            
-        elif choice == '3':
-            run_tests()
-            input("\nPress Enter to continue...")
-            print("\n")
-            
-        elif choice == '4':
-            print("\n👋 Goodbye!\n")
-            break
+    # Warm browser pools for the scrapes chosen from the menu, one per
+    # headless mode, each started by the first scrape that needs it (isolated
+    # scrapes launch their own browser in the child process instead)
+    pools: Dict[bool, BrowserPool] = {}
+    
+    try:
+        while True:
+            print_menu()
+            choice = await _prompt("Enter your choice (1-4): ")
             
-        else:
-            print("\n❌ Invalid choice. Please try again.\n")
+            if choice == '1':
+                await run_default_scrape(pools)
+                await _prompt("\nPress Enter to continue...")
+                print("\n")
+                
+            elif choice == '2':
+                await run_custom_scrape(pools)
+                await _prompt("\nPress Enter to continue...")
+                print("\n")
+                
+            elif choice == '3':
+                await run_tests()
+                await _prompt("\nPress Enter to continue...")
+                print("\n")
+                
+            elif choice == '4':
+                print("\n👋 Goodbye!\n")
+                break
+                
+            else:
+                print("\n❌ Invalid choice. Please try again.\n")
+    finally:
+        for pool in pools.values():
+            await pool.drain()
+
+
+def _run(coro):
+    """Run a coroutine on uvloop when it is installed, else the stdlib loop."""
+    try:
+        import uvloop
+    except ImportError:  # optional (unavailable on Windows)
+        return asyncio.run(coro)
+    return uvloop.run(coro)
 
 
 def main():
@@ -180,9 +499,9 @@ def main():
         # Check if running with command line arguments
         if len(sys.argv) > 1:
             if sys.argv[1] == '--test':
-                run_tests()
+                _run(run_tests())
             elif sys.argv[1] == '--quick':
-                asyncio.run(run_default_scrape())
+                _run(run_default_scrape())
             elif sys.argv[1] == '--help':
                 print("\nUsage:")
                 print("  python run_scraper.py           # Interactive mode")
@@ -195,7 +514,7 @@ def main():
                 print("Use --help for usage information")
         else:
             # Interactive mode
-            asyncio.run(interactive_mode())
+            _run(interactive_mode())
             
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!\n")
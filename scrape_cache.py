@@ -0,0 +1,96 @@
+"""
+Scrape Cache - Persists search results between runs
+Results are stored per (job_title, location, max_jobs) in a small SQLite
+file, so repeating a search within the TTL skips launching the browser.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json
+    orjson = None
+
+from config import CACHE_CONFIG
+
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeCache:
+    """SQLite cache of zlib-compressed JSON job lists with a time-to-live."""
+    
+    def __init__(self, path: str = CACHE_CONFIG['path'], ttl_s: float = CACHE_CONFIG['ttl_s']):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: SQLite database file (created on the first put())
+            ttl_s: Seconds an entry stays fresh
+        """
+        self.path = Path(path)
+        self.ttl_s = ttl_s
+    
+    @staticmethod
+    def key(job_title: str, location: str, max_jobs: int) -> str:
+        """Build the cache key for a search."""
+        return f"{job_title}|{location}|{max_jobs}"
+    
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE IF NOT EXISTS scrapes (key TEXT PRIMARY KEY, ts REAL, payload BLOB)")
+        return conn
+    
+    def _connect_existing(self) -> Optional[sqlite3.Connection]:
+        """Open the database read-only, or return None if nothing was ever stored."""
+        if not self.path.exists():
+            return None
+        return sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+    
+    def get(self, job_title: str, location: str, max_jobs: int) -> Optional[List[Dict]]:
+        """
+        Look up a fresh cached result.
+        
+        Args:
+            job_title: Job title searched for
+            location: Location searched in
+            max_jobs: Maximum number of jobs requested
+        
+        Returns:
+            Cached job dictionaries, or None if missing, expired or unreadable
+        """
+        key = self.key(job_title, location, max_jobs)
+        try:
+            conn = self._connect_existing()
+            if conn is None:
+                return None
+            with closing(conn), conn:
+                row = conn.execute("SELECT ts, payload FROM scrapes WHERE key = ?", (key,)).fetchone()
+            if row is None or time.time() - row[0] >= self.ttl_s:
+                return None
+            data = zlib.decompress(row[1])
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+    
+    def put(self, job_title: str, location: str, max_jobs: int, jobs: List[Dict]):
+        """Store the result of a search, replacing any previous entry."""
+        key = self.key(job_title, location, max_jobs)
+        payload = zlib.compress(orjson.dumps(jobs) if orjson is not None else json.dumps(jobs).encode())
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO scrapes (key, ts, payload) VALUES (?, ?, ?)",
+                    (key, time.time(), payload)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
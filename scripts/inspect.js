@@ -0,0 +1,243 @@
+/*
+ * Inspector helpers shared by inspect_page.py and inspect_job_elements.py.
+ * Registered once per page with add_init_script and called by name, e.g.
+ * page.evaluate("() => window.__inspect.jobStructure()"), so V8 compiles
+ * each helper once instead of on every evaluate.
+ */
+window.__inspect = {
+    // Search box, location field and button details
+    searchForm() {
+        const inspectSearchBoxes = () => {
+            const searchInputs = document.querySelectorAll('input[type="search"], input[role="searchbox"], input.ms-SearchBox-field, input[placeholder*="job"], input[placeholder*="keyword"]');
+            const results = [];
+            searchInputs.forEach((input, idx) => {
+                results.push({
+                    index: idx,
+                    id: input.id || 'N/A',
+                    class: input.className || 'N/A',
+                    placeholder: input.placeholder || 'N/A',
+                    ariaLabel: input.getAttribute('aria-label') || 'N/A',
+                    name: input.name || 'N/A',
+                    role: input.role || 'N/A',
+                    type: input.type || 'N/A',
+                });
+            });
+            return results;
+        };
+
+        const inspectLocationInputs = () => {
+            const locationInputs = document.querySelectorAll('input[placeholder*="location"], input[placeholder*="city"], input[placeholder*="where"], input[aria-label*="location"]');
+            const results = [];
+            locationInputs.forEach((input, idx) => {
+                results.push({
+                    index: idx,
+                    id: input.id || 'N/A',
+                    class: input.className || 'N/A',
+                    placeholder: input.placeholder || 'N/A',
+                    ariaLabel: input.getAttribute('aria-label') || 'N/A',
+                    name: input.name || 'N/A',
+                    role: input.role || 'N/A',
+                    type: input.type || 'N/A',
+                    visible: window.getComputedStyle(input).display !== 'none'
+                });
+            });
+            return results;
+        };
+
+        const inspectButtons = () => {
+            const buttons = document.querySelectorAll('button[type="submit"], button.search-button, button[aria-label*="search"], button[aria-label*="find"]');
+            const results = [];
+            buttons.forEach((btn, idx) => {
+                results.push({
+                    index: idx,
+                    id: btn.id || 'N/A',
+                    class: btn.className || 'N/A',
+                    text: btn.textContent.trim(),
+                    ariaLabel: btn.getAttribute('aria-label') || 'N/A',
+                    type: btn.type || 'N/A',
+                });
+            });
+            return results;
+        };
+
+        return {
+            search: inspectSearchBoxes(),
+            location: inspectLocationInputs(),
+            buttons: inspectButtons(),
+        };
+    },
+
+    // Listing counts, samples and first-job detail
+    resultsPage() {
+        const inspectJobListings = () => {
+            const results = {
+                articles: document.querySelectorAll('article').length,
+                jobListings: document.querySelectorAll('.job-listing').length,
+                jobItems: document.querySelectorAll('.job-item').length,
+                jobCards: document.querySelectorAll('.job-card').length,
+                dataJobId: document.querySelectorAll('[data-job-id]').length,
+                roleArticle: document.querySelectorAll('[role="article"]').length,
+                allDivs: document.querySelectorAll('div[class*="job"]').length,
+            };
+
+            // Get sample structure of first few elements
+            const samples = [];
+
+            // Try to find any job-related container
+            const possibleContainers = document.querySelectorAll('[class*="job"], [data-job], [class*="result"]');
+
+            for (let i = 0; i < Math.min(3, possibleContainers.length); i++) {
+                const elem = possibleContainers[i];
+                const dataAttrs = [];
+                for (const attr of elem.attributes) {
+                    if (attr.name.startsWith('data-')) dataAttrs.push(`${attr.name}="${attr.value}"`);
+                }
+                samples.push({
+                    tagName: elem.tagName,
+                    className: elem.className,
+                    id: elem.id || 'N/A',
+                    dataAttributes: dataAttrs.join(', ') || 'N/A',
+                    innerHTML: elem.innerHTML.substring(0, 200) + '...'
+                });
+            }
+
+            return { counts: results, samples: samples };
+        };
+
+        const inspectFirstJob = () => {
+            // Find the most likely job container
+            const container = document.querySelector('[class*="job"]') ||
+                            document.querySelector('[data-job]') ||
+                            document.querySelector('article') ||
+                            document.querySelector('[class*="result"]');
+
+            if (!container) return null;
+
+            return {
+                outerHTML: container.outerHTML.substring(0, 500),
+                classes: container.className,
+                // Find title elements
+                titles: Array.from(container.querySelectorAll('h1, h2, h3, h4, h5, h6, [class*="title"]')).map(el => ({
+                    tag: el.tagName,
+                    class: el.className,
+                    text: el.textContent.trim().substring(0, 100)
+                })),
+                // Find location elements
+                locations: Array.from(container.querySelectorAll('[class*="location"], [class*="city"]')).map(el => ({
+                    tag: el.tagName,
+                    class: el.className,
+                    text: el.textContent.trim()
+                })),
+                // Find links
+                links: Array.from(container.querySelectorAll('a')).map(el => ({
+                    class: el.className,
+                    href: el.href,
+                    text: el.textContent.trim().substring(0, 50)
+                }))
+            };
+        };
+
+        return {
+            jobs: inspectJobListings(),
+            detailed: inspectFirstJob(),
+        };
+    },
+
+    // Results counter, element counts, job-like elements and job links
+    jobStructure() {
+        const results = {
+            h1Text: document.querySelector('h1')?.textContent || 'Not found',
+            allElements: {},
+            jobElements: []
+        };
+
+        // Count all possible job containers
+        const selectors = [
+            'article',
+            '[role="listitem"]',
+            '[data-job-id]',
+            'li',
+            '[class*="job"]',
+            '[class*="result"]',
+            '[class*="card"]',
+            'ul > *',
+            '[role="list"] > *'
+        ];
+
+        selectors.forEach(sel => {
+            const count = document.querySelectorAll(sel).length;
+            if (count > 0) {
+                results.allElements[sel] = count;
+            }
+        });
+
+        // Find elements near the h1 (likely job containers)
+        const h1 = document.querySelector('h1');
+        if (h1) {
+            // Look at siblings and nearby elements
+            let parent = h1.parentElement;
+            for (let i = 0; i < 5 && parent; i++) {
+                parent = parent.parentElement;
+            }
+
+            if (parent) {
+                // Walk descendants once, accepting only job-like elements
+                // (substantial text and a job-like class or tag)
+                const walker = document.createTreeWalker(parent, NodeFilter.SHOW_ELEMENT, {
+                    acceptNode(el) {
+                        const text = el.textContent || '';
+                        if (text.length <= 50 || text.length >= 2000) return NodeFilter.FILTER_SKIP;
+                        const classes = typeof el.className === 'string' ? el.className : '';
+                        return (classes.includes('job') ||
+                                classes.includes('result') ||
+                                classes.includes('card') ||
+                                classes.includes('item') ||
+                                el.tagName === 'LI' ||
+                                el.tagName === 'ARTICLE')
+                            ? NodeFilter.FILTER_ACCEPT
+                            : NodeFilter.FILTER_SKIP;
+                    }
+                });
+
+                while (results.jobElements.length < 3 && walker.nextNode()) {
+                    const el = walker.currentNode;
+                    const dataAttrs = [];
+                    for (const attr of el.attributes) {
+                        if (attr.name.startsWith('data-')) dataAttrs.push(`${attr.name}="${attr.value}"`);
+                    }
+                    const childrenTags = [];
+                    for (const child of el.children) childrenTags.push(child.tagName);
+                    results.jobElements.push({
+                        tag: el.tagName,
+                        classes: el.className,
+                        id: el.id || 'N/A',
+                        dataAttrs: dataAttrs,
+                        childrenTags: childrenTags,
+                        textPreview: el.textContent.substring(0, 200).trim(),
+                        innerHTML: el.innerHTML.substring(0, 1000)
+                    });
+                }
+            }
+        }
+
+        // Also try to find any clickable job titles (first 5 only)
+        results.jobLinks = [];
+        for (const a of document.querySelectorAll('a')) {
+            if (results.jobLinks.length >= 5) break;
+            const text = a.textContent?.trim() || '';
+            const href = a.href || '';
+            if (text.length > 10 && 
+                text.length < 150 && 
+                (href.includes('job') || href.includes('careers'))) {
+                results.jobLinks.push({
+                    text: text.substring(0, 100),
+                    href: href,
+                    parentTag: a.parentElement?.tagName,
+                    parentClass: a.parentElement?.className
+                });
+            }
+        }
+
+        return results;
+    },
+};
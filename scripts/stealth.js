@@ -0,0 +1,10 @@
+/*
+ * Anti-detection shims for microsoft_scraper.py.
+ * Installed once per context with context.add_init_script(path=...); add
+ * further shims (plugins, languages, chrome runtime) here rather than
+ * registering separate init scripts.
+ */
+
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
@@ -0,0 +1,153 @@
+"""
+Tests for the shared browser pool helpers.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from browser_pool import BrowserPool, RetryAfterTracker, parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+    
+    def test_delay_seconds(self):
+        """Test integer delay-seconds form."""
+        assert parse_retry_after('120') == 120.0
+    
+    def test_http_date(self):
+        """Test HTTP-date form is converted to seconds from now."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 55 <= seconds <= 60
+    
+    def test_past_date_is_zero(self):
+        """Test a date in the past yields no wait."""
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    
+    def test_missing_or_invalid(self):
+        """Test missing or garbage values are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('soon') is None
+
+
+class TestRetryAfterTracker:
+    """Test Retry-After tracking from responses."""
+    
+    def _response(self, status, retry_after=None):
+        headers = {'retry-after': retry_after} if retry_after is not None else {}
+        return Mock(status=status, headers=headers, url='https://example.com')
+    
+    def test_records_429_cooldown(self):
+        """Test a 429 with Retry-After sets a pending cooldown."""
+        tracker = RetryAfterTracker()
+        tracker.observe(self._response(429, '30'))
+        assert 29 <= tracker.peek() <= 30
+    
+    def test_ignores_success_responses(self):
+        """Test non-throttling responses leave the tracker idle."""
+        tracker = RetryAfterTracker()
+        tracker.observe(self._response(200, '30'))
+        assert tracker.peek() == 0.0
+
+
+class TestBrowserPool:
+    """Test browser reuse, replacement and idle cleanup without launching Chromium."""
+    
+    def _pool(self, **kwargs):
+        pool = BrowserPool(check_interval=3600, **kwargs)
+        pool._launch = AsyncMock(side_effect=lambda: Mock(is_connected=Mock(return_value=True), close=AsyncMock()))
+        return pool
+    
+    async def test_reuses_released_browser(self):
+        """Test a released browser is handed out again instead of launching."""
+        pool = self._pool()
+        await pool.initialize(min_size=1, max_size=2)
+        
+        browser = await pool.acquire()
+        await pool.release(browser)
+        assert await pool.acquire() is browser
+        assert pool._launch.await_count == 1
+        await pool.drain(timeout=0)
+    
+    async def test_acquire_times_out_when_full(self):
+        """Test acquire() gives up once max_size browsers stay busy."""
+        pool = self._pool()
+        await pool.initialize(min_size=0, max_size=1)
+        
+        await pool.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.acquire(timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.acquire(timeout=0)
+        await pool.drain(timeout=0)
+    
+    async def test_acquire_without_waiting(self):
+        """Test timeout=0 still hands out a browser when a slot is free."""
+        pool = self._pool()
+        await pool.initialize(min_size=1, max_size=1)
+        
+        assert await pool.acquire(timeout=0) is not None
+        await pool.drain(timeout=0)
+    
+    async def test_health_check_respects_max_size(self):
+        """Test the top-up never launches past max_size while every slot is busy."""
+        pool = self._pool()
+        await pool.initialize(min_size=2, max_size=2)
+        
+        first, second = await pool.acquire(), await pool.acquire()
+        first.is_connected.return_value = False
+        await pool.release(first)
+        # One browser out, one slot free: the dead one is replaced
+        await pool._check_health()
+        assert len(pool._idle) + len(pool._in_use) == 2
+        
+        # Both slots held by acquire() calls still launching: they fill the pool
+        await pool.release(second)
+        pool._idle.clear()
+        await pool._slots.acquire()
+        await pool._slots.acquire()
+        launches = pool._launch.await_count
+        await pool._check_health()
+        assert pool._launch.await_count == launches
+        await pool.drain(timeout=0)
+    
+    async def test_drain_closes_checked_out_browsers(self):
+        """Test drain waits for busy browsers, then closes them and stops Playwright."""
+        pool = self._pool()
+        await pool.initialize(min_size=1, max_size=2)
+        pool._playwright = Mock(stop=AsyncMock())
+        
+        returned, stuck = await pool.acquire(), await pool.acquire()
+        asyncio.get_running_loop().call_later(0.01, lambda: asyncio.ensure_future(pool.release(returned)))
+        await pool.drain(timeout=0.2)
+        
+        returned.close.assert_awaited_once()
+        stuck.close.assert_awaited_once()
+        assert pool._playwright is None
+    
+    async def test_replaces_disconnected_and_reaps_idle(self):
+        """Test dead browsers are replaced and long-idle extras are closed."""
+        pool = self._pool(idle_timeout=0)
+        await pool.initialize(min_size=1, max_size=3)
+        
+        first, second = await pool.acquire(), await pool.acquire()
+        first.is_connected.return_value = False
+        await pool.release(first)
+        await pool.release(second)
+        assert pool.stats['replaced'] == 1
+        
+        await pool._check_health()
+        await pool._reap_idle()
+        assert len(pool._idle) == 1
+        assert pool.stats['reaped'] == 0
+        
+        pool._idle.appendleft((await pool._launch(), 0.0))
+        await pool._reap_idle()
+        assert len(pool._idle) == 1
+        assert pool.stats['reaped'] == 1
+        await pool.drain()
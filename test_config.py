@@ -0,0 +1,41 @@
+"""
+Tests for scraper configuration.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from config import OUTPUT_CONFIG, SELECTORS, SELECTORS_JOINED, make_output_paths
+
+
+class TestSelectors:
+    """Test selector configuration."""
+    
+    def test_job_listings_prefers_ms_list_cell(self):
+        """Test the verified Microsoft Careers listing selector is tried first."""
+        assert SELECTORS['job_listings'][0] == 'div.ms-List-cell[role="listitem"]'
+    
+    def test_joined_selectors_cover_every_key(self):
+        """Test every selector list has a pre-joined selector-list."""
+        assert SELECTORS_JOINED.keys() == SELECTORS.keys()
+        assert SELECTORS_JOINED['job_listings'].startswith('div.ms-List-cell[role="listitem"], ')
+    
+    def test_selectors_are_frozen(self):
+        """Test selector settings can't be mutated at runtime."""
+        with pytest.raises(TypeError):
+            SELECTORS['job_listings'] = ('article',)
+        assert isinstance(SELECTORS['job_listings'], tuple)
+
+
+class TestOutputPaths:
+    """Test output path generation."""
+    
+    def test_paths_share_one_timestamp(self, tmp_path):
+        """Test CSV and JSON paths use the same timestamped stem."""
+        cfg = dict(OUTPUT_CONFIG, directory=str(tmp_path / 'out'))
+        csv_path, json_path = make_output_paths(datetime(2024, 1, 2, 3, 4, 5), cfg)
+        
+        assert csv_path == tmp_path / 'out' / 'microsoft_ai_jobs_20240102_030405.csv'
+        assert json_path == csv_path.with_suffix('.json')
+        assert csv_path.parent.is_dir()
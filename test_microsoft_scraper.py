@@ -4,6 +4,7 @@ Tests the scraper functionality before running on the actual site.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
@@ -12,10 +13,29 @@ from datetime import datetime
 from playwright.async_api import async_playwright, Page
 from microsoft_scraper import (
     MicrosoftCareersScraper,
-    HumanBehavior
+    HumanBehavior,
+    wait_for_request_quiet
 )
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser():
+    """One Chromium shared by every test in the session (per xdist worker)."""
+    async with async_playwright() as p:
+        b = await p.chromium.launch(headless=True)
+        yield b
+        await b.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(browser):
+    """Fresh page in its own context of the shared browser."""
+    ctx = await browser.new_context()
+    pg = await ctx.new_page()
+    yield pg
+    await ctx.close()
+
+
 class TestHumanBehavior:
     """Test human-like behavior simulation."""
     
@@ -31,42 +51,53 @@ class TestHumanBehavior:
         assert 0.1 <= elapsed <= 0.3, f"Delay was {elapsed}s, expected 0.1-0.2s"
     
     @pytest.mark.asyncio
-    async def test_human_type(self):
+    async def test_random_delay_skipped_without_stealth(self):
+        """Test that random delay is a no-op when stealth is off."""
+        import time
+        
+        start = time.time()
+        await HumanBehavior.random_delay(1.0, 2.0, stealth=False)
+        
+        assert time.time() - start < 0.1
+    
+    @pytest.mark.browser
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_human_type(self, page):
         """Test human-like typing behavior."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            # Create a simple HTML page with input
-            await page.set_content('<input type="text" id="test-input" />')
-            
-            # Type text
-            await HumanBehavior.human_type(page, '#test-input', 'AI')
-            
-            # Verify text was entered
-            value = await page.input_value('#test-input')
-            assert value == 'AI'
-            
-            await browser.close()
+        # Create a simple HTML page with input
+        await page.set_content('<input type="text" id="test-input" />')
+        
+        # Type text
+        await HumanBehavior.human_type(page, '#test-input', 'AI')
+        
+        # Verify text was entered
+        value = await page.input_value('#test-input')
+        assert value == 'AI'
     
     @pytest.mark.asyncio
-    async def test_human_click(self):
+    async def test_human_type_fast(self, monkeypatch):
+        """Test FAST mode fills the field in one call even when stealth is requested."""
+        monkeypatch.setattr(HumanBehavior, 'FAST', True)
+        page = Mock(fill=AsyncMock())
+        
+        await HumanBehavior.human_type(page, '#test-input', 'AI', stealth=True)
+        
+        page.fill.assert_awaited_once_with('#test-input', 'AI')
+        page.locator.assert_not_called()
+    
+    @pytest.mark.browser
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_human_click(self, page):
         """Test human-like clicking behavior."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            # Create a simple HTML page with button
-            await page.set_content('<button id="test-btn" onclick="this.textContent=\'Clicked\'">Click Me</button>')
-            
-            # Click button
-            await HumanBehavior.human_click(page, '#test-btn')
-            
-            # Verify button was clicked
-            text = await page.text_content('#test-btn')
-            assert text == 'Clicked'
-            
-            await browser.close()
+        # Create a simple HTML page with button
+        await page.set_content('<button id="test-btn" onclick="this.textContent=\'Clicked\'">Click Me</button>')
+        
+        # Click button
+        await HumanBehavior.human_click(page, '#test-btn')
+        
+        # Verify button was clicked
+        text = await page.text_content('#test-btn')
+        assert text == 'Clicked'
 
 
 class TestMicrosoftCareersScraper:
@@ -82,6 +113,16 @@ class TestMicrosoftCareersScraper:
         assert scraper.jobs == []
         assert scraper.BASE_URL == "https://careers.microsoft.com/v2/global/en/home.html"
     
+    def test_selectors_come_from_config(self):
+        """Test the scraper reads its selector lists from config rather than keeping copies."""
+        import microsoft_scraper
+        from config import SELECTORS
+        
+        assert microsoft_scraper.LISTING_SELECTORS is SELECTORS['job_listings']
+        assert microsoft_scraper.SEARCH_BUTTON_SELECTORS is SELECTORS['search_button']
+        assert microsoft_scraper.JOB_FIELD_SELECTORS['job_location'] is SELECTORS['job_location']
+    
+    @pytest.mark.browser
     @pytest.mark.asyncio
     async def test_browser_initialization(self):
         """Test browser initializes with correct settings."""
@@ -94,6 +135,7 @@ class TestMicrosoftCareersScraper:
         
         await scraper.close_browser()
     
+    @pytest.mark.browser
     @pytest.mark.asyncio
     async def test_navigate_to_mock_page(self):
         """Test navigation to a mock page."""
@@ -111,6 +153,7 @@ class TestMicrosoftCareersScraper:
         
         await scraper.close_browser()
     
+    @pytest.mark.browser
     @pytest.mark.asyncio
     async def test_search_form_interaction(self):
         """Test interaction with search form."""
@@ -145,13 +188,11 @@ class TestMicrosoftCareersScraper:
         
         await scraper.close_browser()
     
-    @pytest.mark.asyncio
-    async def test_scrape_mock_job_listings(self):
+    @pytest.mark.browser
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_scrape_mock_job_listings(self, page):
         """Test scraping mock job listings."""
         scraper = MicrosoftCareersScraper(headless=True)
-        await scraper.initialize_browser()
-        
-        page = await scraper.context.new_page()
         
         # Create mock job listings
         html_content = """
@@ -191,16 +232,15 @@ class TestMicrosoftCareersScraper:
         assert jobs[1]['title'] == 'Machine Learning Scientist'
         assert jobs[2]['title'] == 'AI Product Manager'
         assert 'Seattle' in jobs[0]['job_location']
-        
-        await scraper.close_browser()
+        # IDs come from the job link when there is no "Job item" aria-label
+        assert [job['job_id'] for job in jobs] == ['123', '456', '789']
     
-    @pytest.mark.asyncio
-    async def test_cookie_consent_handling(self):
+    @pytest.mark.browser
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_cookie_consent_handling(self, page, tmp_path):
         """Test cookie consent popup handling."""
-        scraper = MicrosoftCareersScraper(headless=True)
-        await scraper.initialize_browser()
-        
-        page = await scraper.context.new_page()
+        state_file = tmp_path / 'state.json'
+        scraper = MicrosoftCareersScraper(headless=True, storage_state=state_file)
         
         # Create mock cookie consent
         html_content = """
@@ -222,7 +262,48 @@ class TestMicrosoftCareersScraper:
         # Handle cookie consent
         await scraper.handle_cookie_consent(page)
         
-        await scraper.close_browser()
+        # Cookies are saved so the next run can skip the banner
+        assert state_file.exists()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('warm', [True, False])
+    async def test_cookie_consent_storage_state(self, warm, tmp_path):
+        """Test consent is skipped for contexts restored from storage_state."""
+        scraper = MicrosoftCareersScraper(headless=True, storage_state=tmp_path / 'state.json')
+        context = Mock(storage_state=AsyncMock())
+        button = Mock(wait_for=AsyncMock(), is_visible=AsyncMock(return_value=True))
+        button.or_.return_value = button.first = button
+        page = Mock(context=context, locator=Mock(return_value=button))
+        if warm:
+            scraper._warm_contexts.add(context)
+        
+        with patch.object(HumanBehavior, 'human_click', AsyncMock()):
+            await scraper.handle_cookie_consent(page)
+            await scraper.handle_cookie_consent(page)
+        
+        if warm:
+            button.wait_for.assert_not_awaited()
+            context.storage_state.assert_not_awaited()
+        else:
+            # State is written once, after the first accepted banner
+            context.storage_state.assert_awaited_once_with(path=tmp_path / 'state.json')
+    
+    @pytest.mark.asyncio
+    async def test_cookie_consent_priority(self):
+        """Test the highest-priority visible consent button is clicked, not the first in the DOM."""
+        scraper = MicrosoftCareersScraper(headless=True)
+        visible = {'button:has-text("I agree")', '#cookie-banner button'}
+        
+        def locator(selector):
+            button = Mock(wait_for=AsyncMock(), is_visible=AsyncMock(return_value=selector in visible))
+            button.or_.return_value = button.first = button
+            return button
+        
+        page = Mock(context=Mock(), locator=Mock(side_effect=locator))
+        with patch.object(HumanBehavior, 'human_click', AsyncMock()) as click:
+            await scraper.handle_cookie_consent(page)
+        
+        click.assert_awaited_once_with(page, 'button:has-text("I agree") >> visible=true', stealth=scraper.stealth)
     
     @pytest.mark.asyncio
     async def test_save_to_csv(self, tmp_path):
@@ -304,11 +385,326 @@ class TestMicrosoftCareersScraper:
             assert jobs[0]['title'] == 'AI Engineer'
         finally:
             os.chdir(original_dir)
+    
+    
+    @pytest.mark.asyncio
+    async def test_save_in_threads(self, tmp_path, monkeypatch):
+        """Test save() writes a snapshot of the jobs to CSV and JSON."""
+        scraper = MicrosoftCareersScraper(headless=True)
+        scraper.jobs = [{'title': 'AI Engineer', 'url': '/jobs/123'}]
+        monkeypatch.chdir(tmp_path)
+        
+        save = scraper.save('jobs.csv', 'jobs.json')
+        scraper.jobs = []  # The next batch must not affect the pending save
+        await save
+        
+        import json
+        assert json.loads((tmp_path / 'output' / 'jobs.json').read_text())[0]['title'] == 'AI Engineer'
+        assert 'AI Engineer' in (tmp_path / 'output' / 'jobs.csv').read_text()
+    
+    @pytest.mark.asyncio
+    async def test_block_stylesheets(self):
+        """Test stylesheets are only aborted when block_stylesheets is set."""
+        from microsoft_scraper import _block_handler, _block_with_styles_handler
+        
+        def route(resource_type):
+            return Mock(request=Mock(resource_type=resource_type, url='https://example.com/a'),
+                        abort=AsyncMock(), continue_=AsyncMock())
+        
+        css, image = route('stylesheet'), route('image')
+        await _block_handler(css)
+        await _block_handler(image)
+        css.continue_.assert_awaited_once()
+        image.abort.assert_awaited_once()
+        
+        css = route('stylesheet')
+        await _block_with_styles_handler(css)
+        css.abort.assert_awaited_once()
+
+
+class TestScrapeEntryPoints:
+    """Test scrape() and scrape_many() without launching a browser."""
+    
+    def test_headless_default_from_config(self):
+        """Test the scraper's headless (and so stealth) default follows config.SCRAPER_CONFIG."""
+        from config import SCRAPER_CONFIG
+        
+        scraper = MicrosoftCareersScraper()
+        assert scraper.headless == SCRAPER_CONFIG['headless']
+        assert scraper.stealth == (not SCRAPER_CONFIG['headless'])
+    
+    def test_result_cache_off_by_default(self):
+        """Test repeat searches scrape fresh results unless a cache TTL is set."""
+        assert MicrosoftCareersScraper(headless=True).cache is None
+        assert MicrosoftCareersScraper(headless=True, cache_ttl=60).cache is not None
+    
+    @pytest.mark.asyncio
+    async def test_scrape_serves_cache(self, tmp_path):
+        """Test a cached result is returned without touching the browser."""
+        from scrape_cache import ScrapeCache
+        
+        scraper = MicrosoftCareersScraper(headless=True)
+        scraper.cache = ScrapeCache(tmp_path / 'cache.sqlite', ttl_s=60)
+        scraper.cache.put('AI', 'Seattle', 5, [{'title': 'AI Engineer'}])
+        scraper.initialize_browser = AsyncMock(side_effect=AssertionError("browser launched"))
+        
+        jobs = await scraper.scrape('AI', 'Seattle', 5)
+        
+        assert jobs == scraper.jobs == [{'title': 'AI Engineer'}]
+    
+    @pytest.mark.asyncio
+    async def test_scrape_in_caller_browser(self, tmp_path):
+        """Test a caller's browser gets a context per search, closed afterwards, and the result is cached."""
+        from scrape_cache import ScrapeCache
+        
+        scraper = MicrosoftCareersScraper(headless=True)
+        scraper.cache = ScrapeCache(tmp_path / 'cache.sqlite', ttl_s=60)
+        context = Mock(new_page=AsyncMock(return_value=Mock()), close=AsyncMock())
+        scraper.new_context = AsyncMock(return_value=context)
+        scraper._scrape_page = AsyncMock(return_value=[{'title': 'AI Engineer'}])
+        browser = Mock()
+        
+        assert await scraper.scrape('AI', 'Seattle', 5, browser=browser) == [{'title': 'AI Engineer'}]
+        
+        scraper.new_context.assert_awaited_once_with(browser)
+        context.close.assert_awaited_once()
+        assert scraper.cache.get('AI', 'Seattle', 5) == [{'title': 'AI Engineer'}]
+    
+    @pytest.mark.asyncio
+    async def test_scrape_fetches_details(self):
+        """Test fetch_details fills in descriptions before the result is returned, and is off by default."""
+        async def fetch(jobs):
+            for job in jobs:
+                job['description'] = 'Full description'
+            return jobs
+        
+        for fetch_details, description in ((True, 'Full description'), (False, 'short')):
+            scraper = MicrosoftCareersScraper(headless=True, cache_ttl=0, fetch_details=fetch_details)
+            scraper._scrape_in_browser = AsyncMock(return_value=[{'job_id': '123', 'description': 'short'}])
+            scraper.fetch_job_details = AsyncMock(side_effect=fetch)
+            
+            jobs = await scraper.scrape('AI', 'Seattle', 5)
+            
+            assert jobs[0]['description'] == description
+            assert scraper.fetch_job_details.await_count == int(fetch_details)
+    
+    @pytest.mark.asyncio
+    async def test_scrape_many_isolates_failures(self):
+        """Test each query gets its own result list and a failed search comes back empty."""
+        scraper = MicrosoftCareersScraper(headless=True, cache_ttl=0)
+        
+        async def scrape_page(page, job_title, location, max_jobs):
+            if location == 'Redmond':
+                raise RuntimeError("boom")
+            return [{'title': job_title, 'location': location}]
+        
+        scraper.new_context = AsyncMock(return_value=Mock(new_page=AsyncMock(return_value=Mock()), close=AsyncMock()))
+        scraper._scrape_page = scrape_page
+        
+        results = await scraper.scrape_many([('AI', 'Seattle', 5), ('AI', 'Redmond', 5)], browser=Mock())
+        
+        assert results == [[{'title': 'AI', 'location': 'Seattle'}], []]
+        assert scraper.jobs == [{'title': 'AI', 'location': 'Seattle'}]
+
+
+class FakeEventPage:
+    """Minimal stand-in for Page event registration."""
+    
+    def __init__(self):
+        self.handlers = {}
+    
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+    
+    def remove_listener(self, event, handler):
+        self.handlers[event].remove(handler)
+    
+    def emit(self, event, arg):
+        for handler in list(self.handlers.get(event, [])):
+            handler(arg)
+
+
+class TestRequestQuiet:
+    """Test the bounded network-quiet wait."""
+    
+    @pytest.mark.asyncio
+    async def test_settles_after_requests_finish(self):
+        """Test the wait returns once pending requests finish and stay quiet."""
+        page = FakeEventPage()
+        request = object()
+        
+        async def traffic():
+            page.emit('request', request)
+            await asyncio.sleep(0.1)
+            page.emit('requestfinished', request)
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        settled, _ = await asyncio.gather(wait_for_request_quiet(page, quiet=0.1, timeout=2), traffic())
+        
+        assert settled
+        assert loop.time() - start >= 0.2
+        assert all(not handlers for handlers in page.handlers.values())
+    
+    @pytest.mark.asyncio
+    async def test_times_out_while_requests_pending(self):
+        """Test the wait gives up when a request never finishes."""
+        page = FakeEventPage()
+        
+        async def traffic():
+            page.emit('request', object())
+        
+        settled, _ = await asyncio.gather(wait_for_request_quiet(page, quiet=0.05, timeout=0.2), traffic())
+        
+        assert not settled
+
+
+class TestSearchApi:
+    """Test the search API fast path without network access."""
+    
+    def test_api_job_mapping(self):
+        """Test an API record is mapped onto the scraper's job schema."""
+        scraper = MicrosoftCareersScraper(headless=True, cache_ttl=0)
+        job = scraper._api_job(
+            {
+                'jobId': 1827725,
+                'title': 'AI Engineer',
+                'postingDate': '2024-01-15T00:00:00+00:00',
+                'properties': {'locations': ['Redmond, WA', 'Seattle, WA'], 'description': 'Build AI'},
+            },
+            '2024-01-16T00:00:00+00:00', 'AI', 'Seattle'
+        )
+        
+        assert job['title'] == 'AI Engineer'
+        assert job['job_id'] == '1827725'
+        assert job['url'].endswith('/job/1827725')
+        assert job['job_location'] == 'Redmond, WA, Seattle, WA'
+        assert job['search_term'] == 'AI'
+        assert job['location'] == 'Seattle'
+    
+    @pytest.mark.asyncio
+    async def test_scrape_api_requires_httpx(self):
+        """Test scrape_api fails clearly when httpx isn't installed."""
+        scraper = MicrosoftCareersScraper(headless=True, cache_ttl=0, use_api=True)
+        
+        with patch('microsoft_scraper.httpx', None):
+            with pytest.raises(RuntimeError):
+                await scraper.scrape_api('AI', 'Seattle')
+    
+    @pytest.mark.asyncio
+    async def test_api_page_cache(self):
+        """Test a recent identical API page is served without a request."""
+        import time
+        
+        scraper = MicrosoftCareersScraper(headless=True, cache_ttl=0, use_api=True)
+        records = [{'jobId': 1, 'title': 'AI Engineer'}]
+        scraper._api_pages[('AI', 'Seattle', 1)] = (time.monotonic(), records)
+        
+        # No client is needed on a cache hit
+        assert await scraper._api_page(None, 'AI', 'Seattle', 1) is records
+    
+    @pytest.mark.asyncio
+    async def test_fetch_job_details(self):
+        """Test job descriptions are filled in from the detail API through the session client."""
+        import json
+        
+        from contextlib import asynccontextmanager
+        
+        fake_httpx = Mock(HTTPError=type('HTTPError', (Exception,), {}), TransportError=type('TransportError', (Exception,), {}))
+        body = {'operationResult': {'result': {'description': '<p>Build &amp; ship <b>AI</b></p>'}}}
+        requested = []
+        
+        @asynccontextmanager
+        async def stream(method, url, params=None):
+            requested.append(url)
+            yield Mock(headers={'x-ratelimit-remaining': '3'}, aread=AsyncMock(return_value=json.dumps(body).encode()))
+        
+        scraper = MicrosoftCareersScraper(headless=True, cache_ttl=0)
+        scraper._http = Mock(stream=stream)
+        jobs = [{'job_id': '123', 'description': 'short'}, {'job_id': 'N/A', 'description': 'short'}]
+        
+        with patch('microsoft_scraper.httpx', fake_httpx):
+            await scraper.fetch_job_details(jobs)
+        
+        assert jobs[0]['description'] == 'Build & ship AI'
+        assert jobs[1]['description'] == 'short'
+        assert requested == [scraper.API_JOB_URL.format(job_id='123')]
+        # The server's remaining budget now caps requests to that host
+        assert scraper.host_limiter.caps == {'gcsservices.careers.microsoft.com': 3}
+    
+    @pytest.mark.asyncio
+    async def test_http_client_opened_lazily(self):
+        """Test a session opens its API client on first use, not on enter."""
+        client = Mock(aclose=AsyncMock())
+        scraper = MicrosoftCareersScraper(headless=True, cache_ttl=0)
+        
+        with patch.object(scraper, 'initialize_browser', AsyncMock()), \
+             patch.object(scraper, 'close_browser', AsyncMock()), \
+             patch.object(scraper, '_new_http_client', Mock(return_value=client)) as new_client:
+            async with scraper:
+                assert scraper._http is None
+                async with scraper._http_client() as first:
+                    pass
+                async with scraper._http_client() as second:
+                    pass
+        
+        assert first is second is client
+        new_client.assert_called_once()
+        client.aclose.assert_awaited_once()
+        assert scraper._http is None
+
+
+class TestSearchJobs:
+    """Test the search form flow against a mock page."""
+    
+    @staticmethod
+    def _page(**kwargs):
+        return Mock(fill=AsyncMock(), keyboard=Mock(press=AsyncMock()), **kwargs)
+    
+    @staticmethod
+    async def _first(page, selectors):
+        return selectors[0]
+    
+    @pytest.mark.asyncio
+    async def test_waits_for_results_counter(self):
+        """Test the search waits on the results counter h1, then the first card."""
+        scraper = MicrosoftCareersScraper(headless=True)
+        page = self._page(wait_for_selector=AsyncMock(), wait_for_function=AsyncMock())
+        
+        with patch('microsoft_scraper.first_matching', self._first), \
+             patch.object(HumanBehavior, 'human_click', AsyncMock()) as click:
+            assert await scraper.search_jobs(page, 'AI', 'Seattle') is True
+        
+        click.assert_awaited_once()
+        assert [c.args[0] for c in page.wait_for_selector.await_args_list] == [
+            scraper.JOB_TITLE_SEL, scraper.RESULTS_COUNTER_SEL, scraper.FIRST_CARD_SEL,
+        ]
+        page.wait_for_function.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_settles_when_cards_are_late(self):
+        """Test a missing first card waits for requests to settle instead of failing."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+        
+        scraper = MicrosoftCareersScraper(headless=True)
+        
+        async def wait_for_selector(selector, timeout=None):
+            if selector == scraper.FIRST_CARD_SEL:
+                raise PlaywrightTimeout('timeout')
+        
+        page = self._page(wait_for_selector=AsyncMock(side_effect=wait_for_selector))
+        with patch('microsoft_scraper.first_matching', self._first), \
+             patch.object(HumanBehavior, 'human_click', AsyncMock()), \
+             patch('microsoft_scraper.wait_for_request_quiet', AsyncMock()) as quiet:
+            assert await scraper.search_jobs(page, 'AI', 'Seattle') is True
+        
+        quiet.assert_awaited_once()
 
 
 class TestRetryBehavior:
     """Test retry and backoff strategies."""
     
+    @pytest.mark.browser
     @pytest.mark.asyncio
     async def test_retry_on_timeout(self):
         """Test that retry logic works on timeout."""
@@ -325,16 +721,31 @@ class TestRetryBehavior:
             pass  # Expected
         
         await scraper.close_browser()
+    
+    @pytest.mark.asyncio
+    async def test_navigation_retried_after_timeouts(self):
+        """Test that homepage navigation is retried after timeouts until it succeeds."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+        from tenacity import wait_none
+        
+        scraper = MicrosoftCareersScraper(headless=True)
+        page = Mock(
+            goto=AsyncMock(side_effect=[PlaywrightTimeout('timeout'), PlaywrightTimeout('timeout'), None]),
+            wait_for_selector=AsyncMock(),
+        )
+        
+        navigate = MicrosoftCareersScraper.navigate_to_homepage.retry_with(wait=wait_none())
+        assert await navigate(scraper, page) is True
+        
+        # Failed twice, then succeeded on the third attempt
+        assert page.goto.await_count == 3
+        page.wait_for_selector.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_end_to_end_mock_scrape():
+@pytest.mark.browser
+@pytest.mark.asyncio(loop_scope="session")
+async def test_end_to_end_mock_scrape(page):
     """End-to-end test with complete mock scenario."""
-    scraper = MicrosoftCareersScraper(headless=True)
-    await scraper.initialize_browser()
-    
-    page = await scraper.context.new_page()
-    
     # Create complete mock careers page with inline styles to ensure visibility
     html_content = """
     <!DOCTYPE html>
@@ -380,8 +791,6 @@ async def test_end_to_end_mock_scrape():
     first_article = articles[0]
     title = await first_article.locator('h2').text_content()
     assert 'AI' in title, f"Title should contain 'AI', got: {title}"
-    
-    await scraper.close_browser()
 
 
 if __name__ == "__main__":
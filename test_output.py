@@ -0,0 +1,99 @@
+"""
+Tests for job output writers.
+"""
+
+import csv
+import json
+
+import pytest
+
+import output
+from output import SCHEMA, save_jobs, write_jobs, write_json
+
+
+JOBS = [
+    {'title': 'AI Engineer', 'location': 'Seattle, WA', 'url': 'https://example.com/1'},
+    {'title': 'ML Scientist, "Applied"', 'location': 'Redmond, WA'},
+]
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+class TestWriteJobs:
+    """Test CSV output with and without pyarrow."""
+    
+    @pytest.fixture(params=['pyarrow', 'stdlib'])
+    def backend(self, request, monkeypatch):
+        if request.param == 'pyarrow':
+            pytest.importorskip('pyarrow')
+        else:
+            monkeypatch.setattr(output, 'pa', None)
+        return request.param
+    
+    def test_round_trip(self, backend, tmp_path):
+        """Test rows come back with the same values, in order."""
+        path = write_jobs(JOBS, path=tmp_path / 'jobs.csv')
+        rows = _read_csv(path)
+        
+        assert [row['title'] for row in rows] == ['AI Engineer', 'ML Scientist, "Applied"']
+        assert rows[0]['url'] == 'https://example.com/1'
+        assert rows[1]['url'] == ''
+    
+    def test_default_path_uses_config(self, backend, tmp_path):
+        """Test the default filename comes from the output settings."""
+        cfg = {'directory': str(tmp_path / 'out'), 'csv_prefix': 'jobs', 'json_prefix': 'jobs', 'timestamp_format': '%Y'}
+        path = write_jobs(JOBS, cfg=cfg)
+        
+        assert path.parent == tmp_path / 'out'
+        assert path.name.startswith('jobs_') and path.suffix == '.csv'
+    
+    def test_fieldnames(self, backend, tmp_path):
+        """Test explicit columns set the order and drop unlisted keys."""
+        path = write_jobs(JOBS, path=tmp_path / 'jobs.csv', fieldnames=('url', 'title'))
+        rows = _read_csv(path)
+        
+        assert list(rows[0]) == ['url', 'title']
+        assert rows[1] == {'url': '', 'title': 'ML Scientist, "Applied"'}
+    
+    def test_no_rows(self, tmp_path):
+        """Test nothing is written for an empty result set."""
+        assert write_jobs([], path=tmp_path / 'jobs.csv') is None
+        assert not (tmp_path / 'jobs.csv').exists()
+
+
+class TestWriteJson:
+    """Test JSON output with and without orjson."""
+    
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_round_trip(self, use_orjson, tmp_path, monkeypatch):
+        """Test rows come back unchanged, non-ASCII included."""
+        if not use_orjson:
+            monkeypatch.setattr(output, 'orjson', None)
+        jobs = JOBS + [{'title': 'Ingénieur IA'}]
+        
+        path = write_json(jobs, path=tmp_path / 'jobs.json')
+        
+        assert json.loads(path.read_text(encoding='utf-8')) == jobs
+    
+    def test_no_rows(self, tmp_path):
+        """Test nothing is written for an empty result set."""
+        assert write_json([], path=tmp_path / 'jobs.json') is None
+        assert not (tmp_path / 'jobs.json').exists()
+
+
+class TestSaveJobs:
+    """Test saving CSV and JSON together off the event loop."""
+    
+    async def test_default_paths_share_timestamp(self, tmp_path):
+        """Test both files land in the configured directory with one stem, CSV in schema order."""
+        cfg = {'directory': str(tmp_path / 'out'), 'csv_prefix': 'jobs', 'json_prefix': 'jobs', 'timestamp_format': '%Y%m%d_%H%M%S'}
+        
+        csv_path, json_path = await save_jobs(JOBS, cfg=cfg)
+        
+        assert csv_path.parent == tmp_path / 'out'
+        assert json_path == csv_path.with_suffix('.json')
+        assert list(_read_csv(csv_path)[0]) == list(SCHEMA)
+        assert json.loads(json_path.read_text(encoding='utf-8')) == JOBS
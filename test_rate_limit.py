@@ -0,0 +1,149 @@
+"""
+Tests for client-side rate limiting.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from rate_limit import AIMDController, HostRateLimiter, TokenBucket
+
+
+@pytest.mark.asyncio
+class TestTokenBucket:
+    """Test token bucket pacing."""
+    
+    async def test_burst_is_immediate(self):
+        """Test up to `burst` acquisitions don't wait."""
+        bucket = TokenBucket(rps=1, burst=3)
+        start = time.monotonic()
+        
+        for _ in range(3):
+            await bucket.acquire()
+        
+        assert time.monotonic() - start < 0.05
+    
+    async def test_paces_after_burst(self):
+        """Test acquisitions beyond the burst are spaced at 1/rps."""
+        bucket = TokenBucket(rps=20, burst=1)
+        start = time.monotonic()
+        
+        for _ in range(3):
+            await bucket.acquire()
+        
+        assert time.monotonic() - start >= 0.09
+    
+    async def test_concurrent_callers_queue(self):
+        """Test concurrent waiters are each given their own slot."""
+        bucket = TokenBucket(rps=20, burst=1)
+        start = time.monotonic()
+        
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+        
+        assert time.monotonic() - start >= 0.14
+
+
+@pytest.mark.asyncio
+class TestAIMDController:
+    """Test adaptive concurrency control."""
+    
+    async def test_additive_increase_on_fast_success(self):
+        """Test a call within the target latency raises the limit by alpha."""
+        controller = AIMDController(concurrency=2, target_latency=1, alpha=0.5)
+        
+        async with controller.admit():
+            pass
+        
+        assert controller.concurrency == 2.5
+    
+    async def test_multiplicative_decrease_on_error(self):
+        """Test a failed call multiplies the limit by beta."""
+        controller = AIMDController(concurrency=4, beta=0.5)
+        
+        with pytest.raises(RuntimeError):
+            async with controller.admit():
+                raise RuntimeError("boom")
+        
+        assert controller.concurrency == 2
+        assert controller.in_flight == 0
+    
+    async def test_decrease_on_slow_call(self):
+        """Test a call slower than the target latency shrinks the limit."""
+        controller = AIMDController(concurrency=4, target_latency=0.01, beta=0.5)
+        
+        async with controller.admit():
+            await asyncio.sleep(0.03)
+        
+        assert controller.concurrency == 2
+    
+    async def test_limits_calls_in_flight(self):
+        """Test no more than int(concurrency) calls run at once."""
+        controller = AIMDController(concurrency=2, alpha=0)
+        peak = 0
+        
+        async def call():
+            nonlocal peak
+            async with controller.admit():
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+        
+        await asyncio.gather(*(call() for _ in range(6)))
+        
+        assert peak == 2
+    
+    async def test_retry_after_pauses_admission(self):
+        """Test a Retry-After cooldown delays the next call and shrinks the limit."""
+        controller = AIMDController(concurrency=4, beta=0.5)
+        controller.retry_after(0.05)
+        start = time.monotonic()
+        
+        async with controller.admit():
+            pass
+        
+        assert time.monotonic() - start >= 0.04
+        assert controller.concurrency == 2.5
+    
+    async def test_cooldown_does_not_block_release(self):
+        """Test a call can finish while another caller sleeps out a cooldown."""
+        controller = AIMDController(concurrency=1, beta=1)
+        
+        async with controller.admit():
+            controller.retry_after(0.2)
+            waiter = asyncio.create_task(controller.admit().__aenter__())
+            await asyncio.sleep(0.01)
+            start = time.monotonic()
+        released = time.monotonic() - start
+        
+        assert released < 0.1
+        assert controller.in_flight == 0
+        await waiter
+        assert controller.in_flight == 1
+
+
+@pytest.mark.asyncio
+class TestHostRateLimiter:
+    """Test per-host concurrency caps."""
+    
+    async def test_cap_follows_ratelimit_remaining(self):
+        """Test X-RateLimit-Remaining lowers one host's cap without affecting others."""
+        limiter = HostRateLimiter(limit=4)
+        limiter.observe('https://api.example.com/a', {'x-ratelimit-remaining': '1'})
+        limiter.observe('https://api.example.com/b', {'x-ratelimit-remaining': 'n/a'})
+        peak = in_flight = 0
+        
+        async def call(url):
+            nonlocal peak, in_flight
+            async with limiter.slot(url):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+        
+        await asyncio.gather(*(call('https://api.example.com/x') for _ in range(3)))
+        assert peak == 1
+        assert limiter.caps == {'api.example.com': 1}
+        
+        peak = 0
+        await asyncio.gather(*(call('https://other.example.com/x') for _ in range(6)))
+        assert peak == 4
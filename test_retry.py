@@ -0,0 +1,91 @@
+"""
+Tests for the jittered exponential-backoff retry helper.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+
+from retry import backoff_delay, retry_async
+
+
+class TestBackoffDelay:
+    """Test full-jitter delay computation."""
+    
+    def test_delay_within_exponential_bound(self):
+        """Test delay never exceeds base * multiplier**attempt."""
+        for attempt in range(4):
+            delay = backoff_delay(attempt, backoff_min=1, backoff_max=100, multiplier=2)
+            assert 0 <= delay <= 2 ** attempt
+    
+    def test_delay_capped_at_max(self):
+        """Test delay is capped by backoff_max."""
+        for _ in range(20):
+            assert backoff_delay(10, backoff_min=4, backoff_max=30, multiplier=2) <= 30
+
+
+class TestRetryAsync:
+    """Test retry_async behavior."""
+    
+    @pytest.mark.asyncio
+    async def test_returns_first_success(self):
+        """Test result is returned without retrying on success."""
+        fn = AsyncMock(return_value='ok')
+        
+        assert await retry_async(fn, max_attempts=3) == 'ok'
+        assert fn.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_retries_playwright_errors(self):
+        """Test transient Playwright errors are retried until success."""
+        fn = AsyncMock(side_effect=[PlaywrightTimeout('timeout'), PlaywrightError('503'), 'ok'])
+        
+        with patch('retry.asyncio.sleep', new=AsyncMock()) as sleep:
+            assert await retry_async(fn, max_attempts=3, backoff_min=0.1, backoff_max=1, multiplier=2) == 'ok'
+        
+        assert fn.await_count == 3
+        assert sleep.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_reraises_after_max_attempts(self):
+        """Test the last error propagates once attempts are exhausted."""
+        fn = AsyncMock(side_effect=PlaywrightTimeout('timeout'))
+        
+        with patch('retry.asyncio.sleep', new=AsyncMock()):
+            with pytest.raises(PlaywrightTimeout):
+                await retry_async(fn, max_attempts=2)
+        
+        assert fn.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_does_not_retry_other_errors(self):
+        """Test non-Playwright errors propagate immediately."""
+        fn = AsyncMock(side_effect=ValueError('bad'))
+        
+        with pytest.raises(ValueError):
+            await retry_async(fn, max_attempts=3)
+        
+        assert fn.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_retry_on_custom_errors(self):
+        """Test retry_on selects which errors are retried."""
+        fn = AsyncMock(side_effect=[ConnectionError('reset'), 'ok'])
+        
+        with patch('retry.asyncio.sleep', new=AsyncMock()):
+            assert await retry_async(fn, max_attempts=2, retry_on=(ConnectionError,)) == 'ok'
+        
+        assert fn.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_honors_retry_after_tracker(self):
+        """Test a pending Retry-After cooldown overrides a shorter backoff."""
+        fn = AsyncMock(side_effect=[PlaywrightTimeout('timeout'), 'ok'])
+        tracker = Mock()
+        tracker.peek.return_value = 5.0
+        
+        with patch('retry.asyncio.sleep', new=AsyncMock()) as sleep:
+            await retry_async(fn, max_attempts=2, backoff_min=0.1, backoff_max=1, multiplier=2, tracker=tracker)
+        
+        sleep.assert_awaited_once_with(5.0)
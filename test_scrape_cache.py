@@ -0,0 +1,49 @@
+"""
+Tests for the persistent scrape result cache.
+"""
+
+from unittest.mock import patch
+
+from scrape_cache import ScrapeCache
+
+
+JOBS = [{'title': 'AI Engineer', 'job_location': 'Redmond, WA'}]
+
+
+class TestScrapeCache:
+    """Test cache hits, misses and expiry."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test a stored result is returned for the same search."""
+        cache = ScrapeCache(tmp_path / 'cache.sqlite', ttl_s=60)
+        cache.put('AI', 'Seattle', 50, JOBS)
+        
+        assert cache.get('AI', 'Seattle', 50) == JOBS
+    
+    def test_miss_for_other_search(self, tmp_path):
+        """Test a different title, location or limit is a miss."""
+        cache = ScrapeCache(tmp_path / 'cache.sqlite', ttl_s=60)
+        cache.put('AI', 'Seattle', 50, JOBS)
+        
+        assert cache.get('AI', 'Seattle', 10) is None
+        assert cache.get('AI', 'Redmond', 50) is None
+        assert cache.get('Data', 'Seattle', 50) is None
+    
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Test entries older than the TTL are ignored."""
+        cache = ScrapeCache(tmp_path / 'cache.sqlite', ttl_s=60)
+        with patch('scrape_cache.time.time', return_value=1000.0):
+            cache.put('AI', 'Seattle', 50, JOBS)
+        
+        with patch('scrape_cache.time.time', return_value=1061.0):
+            assert cache.get('AI', 'Seattle', 50) is None
+    
+    def test_created_on_first_put(self, tmp_path):
+        """Test a lookup never creates the database; the first store does, with its directory."""
+        cache = ScrapeCache(tmp_path / 'nested' / 'cache.sqlite', ttl_s=60)
+        
+        assert cache.get('AI', 'Seattle', 50) is None
+        assert not (tmp_path / 'nested').exists()
+        
+        cache.put('AI', 'Seattle', 50, JOBS)
+        assert (tmp_path / 'nested' / 'cache.sqlite').exists()